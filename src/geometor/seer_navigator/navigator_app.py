@@ -0,0 +1,63 @@
+"""Shared behaviour for the SessionsNavigator and TasksNavigator apps."""
+
+import subprocess
+
+from textual import log
+from textual.app import App
+
+from geometor.seer_navigator.screens.sort_modal import SortModal
+
+
+class NavigatorApp(App):
+    """Base App holding the helpers both navigators share."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._sort_modal: SortModal | None = None # Installed modal, reused across sorts
+        self._sort_modal_columns = None           # Columns dict the modal was built for
+        self._sxiv_proc: subprocess.Popen | None = None # Last sxiv viewer started
+        self._sxiv_list: str | None = None               # Newline-joined files it shows
+
+    def _get_sort_modal(self, columns) -> SortModal:
+        """Return the SortModal for these table columns, building it on first use.
+
+        The modal is installed so it survives being dismissed and can be
+        pushed again without re-running compose; it is rebuilt only when
+        sorting a different table. The modal resets its list on each open.
+        """
+        if (
+            self._sort_modal is None
+            or self._sort_modal_columns is not columns
+            or len(self._sort_modal.column_options) != len(columns)
+        ):
+            if self._sort_modal is not None:
+                self.uninstall_screen(self._sort_modal)
+            self._sort_modal = SortModal(columns=columns)
+            self._sort_modal_columns = columns
+            self.install_screen(self._sort_modal, name="sort-modal")
+        return self._sort_modal
+
+    def _open_in_sxiv(self, sxiv_cmd: str, image_files: list) -> None:
+        """Shows image_files in sxiv, reusing the open viewer if it already shows them.
+
+        sxiv cannot be handed new files once running, so a viewer is only
+        reused for an identical list; otherwise a new one is started with the
+        list piped to stdin ('-i'), which also sidesteps argv length limits.
+        """
+        image_list = "\n".join(str(img_path) for img_path in image_files)
+        if self._sxiv_proc is not None and self._sxiv_proc.poll() is None and image_list == self._sxiv_list:
+            log.info("sxiv is already showing these images; not starting another viewer.")
+            self.notify("These images are already open in sxiv.")
+            return
+        proc = subprocess.Popen(
+            [sxiv_cmd, "-i"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True, # Keep the viewer out of our TTY and session
+            text=True,
+        )
+        proc.stdin.write(image_list + "\n")
+        proc.stdin.close()
+        self._sxiv_proc, self._sxiv_list = proc, image_list
+
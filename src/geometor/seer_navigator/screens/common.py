@@ -0,0 +1,87 @@
+"""Helpers shared by the task and session screens."""
+
+import functools
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
+
+try:
+    import orjson # Optional: faster parsing of the many small index.json files
+except ImportError:
+    orjson = None
+
+from rich.text import Text
+
+from geometor.seer.session.level import Level
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+def load_json(path: Path) -> dict:
+    """Parses a JSON file with orjson when available, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def mtime_ns(path: Path) -> int | None:
+    """Returns the path's mtime in nanoseconds, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Upper bound on concurrent summary reads
+MAX_READ_WORKERS = 8
+
+
+def read_concurrently(load: Callable, items: Iterable) -> list[Future]:
+    """Calls ``load`` on every item concurrently.
+
+    Returns one completed future per item, in the same order;
+    ``future.result()`` gives the loaded value or re-raises the load error.
+    Overlapping the reads hides per-file latency on network filesystems.
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(items))) as executor:
+        return [executor.submit(load, item) for item in items]
+
+
+# Large tables insert their rows in windows of ROW_WINDOW as the cursor nears
+# the end; ROW_PREFETCH rows past the cursor are always present, enough for a
+# page-down in a tall terminal to land on inserted rows
+ROW_WINDOW = 200
+ROW_PREFETCH = 50
+
+
+def rows_to_load(index: int, loaded: int) -> int:
+    """Returns how many rows to append so the row at ``index`` plus the
+    prefetch margin is in a table holding ``loaded`` rows; 0 if it already is."""
+    if index + ROW_PREFETCH < loaded:
+        return 0
+    return max(ROW_WINDOW, index + ROW_PREFETCH + 1 - loaded)
+
+
+@functools.lru_cache(maxsize=4096)
+def format_seconds(seconds: int) -> str:
+    """Level._format_duration memoized on whole seconds, its display resolution."""
+    return Level._format_duration(seconds)
+
+
+# Shared glyph cells for the screens' tables; DataTable only reads cell renderables
+TICK = Text("✔", style="green", justify="center")
+CROSS = Text("✘", style="red", justify="center")
+WARN = Text("⚠", style="bold #FFD700", justify="center")
+DASH_CENTER = Text("-", justify="center")
+BOOL_MAP = {True: TICK, False: CROSS, None: DASH_CENTER}
+
+
+@functools.lru_cache(maxsize=4096)
+def text_right(value: str) -> Text:
+    """Shared right-justified cell for a value; '-' and common counts repeat a lot."""
+    return Text(value, justify="right")
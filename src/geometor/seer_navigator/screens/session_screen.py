@@ -25,7 +25,7 @@ import json
 
 # Import Task to calculate weight
 from geometor.seer.tasks.tasks import Task
-from geometor.seer_navigator.screens.task_screen import TaskScreen
+from geometor.seer_navigator.screens.task_screen import TaskScreen, list_step_dirs
 from geometor.seer.session.level import Level  # Import Level
 
 
@@ -406,7 +406,7 @@ class SessionScreen(Screen):
         task_path = self.session_path / task_name
 
         # Get step directories for the selected task
-        step_dirs = sorted([d for d in task_path.iterdir() if d.is_dir()])
+        step_dirs = list_step_dirs(task_path)
         self.app.push_screen(TaskScreen(self.session_path, task_path, step_dirs))
 
     # REMOVED action_view_images method
@@ -21,12 +21,79 @@ from textual.widgets._data_table import ColumnKey # ADDED ColumnKey
 # REMOVED subprocess import
 # REMOVED shutil import
 
+from geometor.seer_navigator.screens.common import read_concurrently
 from geometor.seer_navigator.screens.session_screen import SessionScreen
+from geometor.seer_navigator.screens.sort_parsers import (
+    parse_string,
+    parse_number,
+    parse_time,
+    resolve_sort_parsers,
+)
 from geometor.seer.session.level import Level  # Import Level
 from geometor.seer.tasks.tasks import Task # ADDED Task import for weight calculation
 
 import json  # Import the json module
 
+try:
+    import ijson # Optional: stream only the summary keys we need
+except ImportError:
+    ijson = None
+
+
+# Top-level index.json keys read by the sessions table and summary
+_REQUIRED_KEYS = frozenset({
+    "count",
+    "train_passed",
+    "test_passed",
+    "total_steps",
+    "duration_seconds",
+    "tasks_with_errors_count",
+    "tokens",
+    "description",
+})
+
+
+def _load_summary(summary_path: Path) -> dict:
+    """Loads the session summary keys from index.json.
+
+    With ijson available, parsing stops as soon as every required key has
+    been seen, so large per-task sections later in the file are skipped.
+    Falls back to a full json.load otherwise.
+    """
+    if ijson is None:
+        with open(summary_path, "r") as f:
+            return json.load(f)
+
+    summary = {}
+    with open(summary_path, "rb") as f:
+        try:
+            for key, value in ijson.kvitems(f, "", use_float=True):
+                if key in _REQUIRED_KEYS:
+                    summary[key] = value
+                    if len(summary) == len(_REQUIRED_KEYS):
+                        break
+        except ijson.JSONError as e:
+            # Surface parse errors the same way json.load would
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    return summary
+
+
+# Sort key parser for each main table column, keyed by column label
+SORT_PARSERS = {
+    "SESSION": parse_string,
+    "DESC": parse_string,
+    "ERROR": parse_number,
+    "TEST": parse_number,
+    "TRAIN": parse_number,
+    "TASKS": parse_number,
+    "STEPS": parse_number,
+    "WEIGHT": parse_number,
+    "IN": parse_number,
+    "OUT": parse_number,
+    "TOTAL": parse_number,
+    "TIME": parse_time,
+}
+
 
 class SessionsScreen(Screen):
     CSS = """
@@ -70,6 +137,9 @@ class SessionsScreen(Screen):
         self.sessions_root = Path(sessions_root).absolute()
         self.session_dirs = []  # Store sibling dirs here
         self.session_index = 0
+        # (summary, weight) per readable session from load_sessions, aggregated
+        # by update_summary so no index.json or task.json is read twice
+        self._session_summaries: list[tuple[dict, int | None]] = []
         # REMOVED sxiv check state attributes
         self.current_sort_key: ColumnKey | None = None # ADDED sort state
         self.current_sort_reverse: bool = False      # ADDED sort state
@@ -80,7 +150,7 @@ class SessionsScreen(Screen):
         self.table = DataTable() # Main sessions table
         # Add columns in the new requested order, changing DURATION to TIME
         # Right-align TEST, TRAIN, TIME, ERROR headers
-        self.table.add_columns(
+        self._col_keys: list[ColumnKey] = self.table.add_columns(
             "SESSION",
             Text("ERROR", justify="center"),               # ADDED & ALIGNED
             Text("TEST", justify="right"),                 # MOVED & ALIGNED
@@ -94,6 +164,8 @@ class SessionsScreen(Screen):
             Text("WEIGHT", justify="right"), # ADDED WEIGHT column
             "DESC",                          # ADDED DESC column
         )
+        # Column order is fixed from here on; resolve each column's sort parser once
+        self._sort_parsers = resolve_sort_parsers(self.table, SORT_PARSERS)
         self.table.cursor_type = "row"
 
         yield Header()
@@ -133,11 +205,11 @@ class SessionsScreen(Screen):
         self.session_dirs = sorted(self.session_dirs, key=lambda d: d.name)
         self.session_index = 0
         self.table.clear() # Clear existing rows
-        for session_dir in self.session_dirs:
-            summary_path = session_dir / "index.json"
+        self._session_summaries = []
+        summaries = read_concurrently(_load_summary, [d / "index.json" for d in self.session_dirs])
+        for session_dir, summary_future in zip(self.session_dirs, summaries):
             try:
-                with open(summary_path, 'r') as f:
-                    summary = json.load(f)
+                summary = summary_future.result()
                 num_tasks = Text(str(summary.get("count", 0)), style="", justify="right") # Use new 'count' key
                 num_steps = Text(str(summary.get("total_steps", 0)), style="", justify="right") # Get total_steps
 
@@ -189,22 +261,25 @@ class SessionsScreen(Screen):
                 try:
                     for item in session_dir.iterdir():
                         if item.is_dir(): # Check if it's a task directory
-                            task_json_path = item / "task.json"
-                            if task_json_path.exists():
-                                try:
-                                    with open(task_json_path, "r") as f_task:
-                                        task_data = json.load(f_task)
-                                    task_obj = Task(item.name, task_data)
-                                    session_total_weight += task_obj.weight
-                                except (json.JSONDecodeError, Exception) as e_task:
-                                    log.error(f"Error loading/processing task {item.name} for weight: {e_task}")
-                                    # Optionally mark weight as error? For now, just skip adding its weight.
+                            # Open directly rather than exists() + open(), saving a stat per task
+                            try:
+                                with open(item / "task.json", "r") as f_task:
+                                    task_data = json.load(f_task)
+                                task_obj = Task(item.name, task_data)
+                                session_total_weight += task_obj.weight
+                            except FileNotFoundError:
+                                continue # Not a task directory with a task.json
+                            except (json.JSONDecodeError, Exception) as e_task:
+                                log.error(f"Error loading/processing task {item.name} for weight: {e_task}")
+                                # Optionally mark weight as error? For now, just skip adding its weight.
                 except Exception as e_session:
                     log.error(f"Error iterating tasks for weight in session {session_dir.name}: {e_session}")
                     # Indicate error in the weight column?
                     session_weight_text = Text("ERR", style="bold red", justify="right")
+                    self._session_summaries.append((summary, None))
                 else:
                     session_weight_text = Text(f"{session_total_weight:,}", justify="right") # Format with comma
+                    self._session_summaries.append((summary, session_total_weight))
                 # --- END ADDED WEIGHT CALCULATION ---
 
                 # --- START ADDED DESCRIPTION HANDLING ---
@@ -241,7 +316,7 @@ class SessionsScreen(Screen):
         trials_table = self.query_one("#trials-table", DataTable)
         tokens_table = self.query_one("#tokens-table", DataTable)
 
-        num_sessions = 0
+        num_sessions = len(self.session_dirs) # Includes sessions without a readable index.json
         total_tasks_count = 0 # New counter for total tasks
         train_passed_count = 0
         test_passed_count = 0
@@ -255,63 +330,37 @@ class SessionsScreen(Screen):
         # --- END ADDED TOKEN COUNTERS ---
         grand_total_weight = 0 # ADDED grand total weight counter
 
-        for session_dir in self.sessions_root.iterdir():  # Iterate over sessions_root
-            if session_dir.is_dir():
-                num_sessions += 1
-                summary_path = session_dir / "index.json"
-                try:
-                    with open(summary_path, "r") as f:
-                        session_summary = json.load(f)
-
-                    total_tasks_count += session_summary.get("count", 0) # Sum tasks - Use new 'count' key
-                    train_passed_count += session_summary.get("train_passed", 0) # Use new 'train_passed' key
-                    test_passed_count += session_summary.get("test_passed", 0) # Use new 'test_passed' key
-                    total_steps += session_summary.get("total_steps", 0)
-                    # Use the correct key for the total error count from the session summary
-                    total_error_count += session_summary.get("tasks_with_errors_count", 0) # Accumulate errors
-
-                    # Sum duration
-                    duration = session_summary.get("duration_seconds")
-                    if duration is not None:
-                        total_duration_seconds += duration
-
-                    # --- START ADDED TOKEN ACCUMULATION ---
-                    tokens_data = session_summary.get("tokens", {})
-                    prompt_tokens = tokens_data.get("prompt_tokens")
-                    candidates_tokens = tokens_data.get("candidates_tokens")
-                    total_tokens = tokens_data.get("total_tokens")
-
-                    if prompt_tokens is not None:
-                        grand_total_prompt_tokens += prompt_tokens
-                    if candidates_tokens is not None:
-                        grand_total_candidates_tokens += candidates_tokens
-                    if total_tokens is not None:
-                        grand_total_tokens_all_sessions += total_tokens
-                    # --- END ADDED TOKEN ACCUMULATION ---
-
-                    # --- START ADDED WEIGHT ACCUMULATION ---
-                    try:
-                        session_weight = 0
-                        for item in session_dir.iterdir():
-                            if item.is_dir():
-                                task_json_path = item / "task.json"
-                                if task_json_path.exists():
-                                    try:
-                                        with open(task_json_path, "r") as f_task:
-                                            task_data = json.load(f_task)
-                                        task_obj = Task(item.name, task_data)
-                                        session_weight += task_obj.weight
-                                    except (json.JSONDecodeError, Exception):
-                                        # Error logged during row creation, ignore here for summary
-                                        pass
-                        grand_total_weight += session_weight
-                    except Exception as e_weight_sum:
-                        log.error(f"Error summing weight for session {session_dir.name} in summary: {e_weight_sum}")
-                    # --- END ADDED WEIGHT ACCUMULATION ---
-
-
-                except (FileNotFoundError, json.JSONDecodeError):
-                    pass # Skip sessions with missing/invalid index.json
+        # Aggregate the summaries load_sessions already read
+        for session_summary, session_weight in self._session_summaries:
+            total_tasks_count += session_summary.get("count", 0) # Sum tasks - Use new 'count' key
+            train_passed_count += session_summary.get("train_passed", 0) # Use new 'train_passed' key
+            test_passed_count += session_summary.get("test_passed", 0) # Use new 'test_passed' key
+            total_steps += session_summary.get("total_steps", 0)
+            # Use the correct key for the total error count from the session summary
+            total_error_count += session_summary.get("tasks_with_errors_count", 0) # Accumulate errors
+
+            # Sum duration
+            duration = session_summary.get("duration_seconds")
+            if duration is not None:
+                total_duration_seconds += duration
+
+            # --- START ADDED TOKEN ACCUMULATION ---
+            tokens_data = session_summary.get("tokens", {})
+            prompt_tokens = tokens_data.get("prompt_tokens")
+            candidates_tokens = tokens_data.get("candidates_tokens")
+            total_tokens = tokens_data.get("total_tokens")
+
+            if prompt_tokens is not None:
+                grand_total_prompt_tokens += prompt_tokens
+            if candidates_tokens is not None:
+                grand_total_candidates_tokens += candidates_tokens
+            if total_tokens is not None:
+                grand_total_tokens_all_sessions += total_tokens
+            # --- END ADDED TOKEN ACCUMULATION ---
+
+            # Weight was summed per session during load_sessions (None if that failed)
+            if session_weight is not None:
+                grand_total_weight += session_weight
 
         # Format total duration
         formatted_total_duration = Level._format_duration(total_duration_seconds)
@@ -459,44 +508,7 @@ class SessionsScreen(Screen):
         self.current_sort_key = sort_key
         self.current_sort_reverse = reverse
 
-        # Define key function: receives cell_data directly when sorting by one key
-        def get_sort_key(cell_data):
-            # No need to find index or extract cell_data, it's passed directly.
-            key_str = str(sort_key) # Use string representation of the *column* key
-
-            if key_str in ["SESSION", "DESC"]:
-                return cell_data # Simple string sort
-
-            if key_str in ["ERROR", "TEST", "TRAIN", "TASKS", "STEPS", "WEIGHT", "IN", "OUT", "TOTAL"]:
-                # These columns contain Text objects, extract plain text and convert to number
-                plain_text = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                plain_text = plain_text.replace(',', '') # Remove commas for weight/tokens
-                if plain_text == "-":
-                    return -1 # Sort '-' values first or last? Let's try first.
-                try:
-                    # Use float for potential future non-integer values, though int is likely fine now
-                    return float(plain_text)
-                except ValueError:
-                    log.warning(f"Could not convert '{plain_text}' to float for sorting key '{key_str}'")
-                    return float('-inf') # Sort errors consistently
-
-            if key_str == "TIME":
-                # Parse HH:MM:SS string into seconds
-                time_str = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                if time_str == "-":
-                    return -1
-                try:
-                    parts = list(map(int, time_str.split(':')))
-                    if len(parts) == 3:
-                        return parts[0] * 3600 + parts[1] * 60 + parts[2]
-                    else:
-                        return float('-inf') # Invalid format
-                except ValueError:
-                    log.warning(f"Could not parse time string '{time_str}' for sorting")
-                    return float('-inf')
-
-            # Fallback: Ensure a string is always returned for comparison
-            return str(cell_data.plain) if hasattr(cell_data, 'plain') else str(cell_data)
+        get_sort_key = self._sort_parsers.get(sort_key, parse_string)
 
         # Perform the sort using the DataTable's sort method
         try:
@@ -1,23 +1,61 @@
 """Defines the SortModal screen for selecting a DataTable column to sort."""
 
-from typing import Dict, Union, List, Tuple # Added List, Tuple
+import sys
+from typing import ClassVar, Dict, Union, List, Tuple # Added List, Tuple
 
 from textual.app import ComposeResult
-from textual.containers import Vertical, Container # Added Container
+from textual.containers import Vertical
 # Use ModalScreen[ReturnType] to specify what dismiss returns
 from textual.screen import ModalScreen
-# Import ListView and ListItem, remove Button
 from textual.widgets import Label, ListView, ListItem
 from textual.binding import Binding
 from textual.widgets._data_table import ColumnKey
 from textual import log, on # Added on decorator
+from textual.css.query import NoMatches
+
+
+# Sorted (label, key) options per column set, reused across modal opens
+_OPTIONS_CACHE: Dict[Tuple[ColumnKey, ...], Tuple[Tuple[str, ColumnKey], ...]] = {}
+_OPTIONS_CACHE_SIZE = 8
+
+
+def _column_options(columns: Dict[ColumnKey, object]) -> Tuple[Tuple[str, ColumnKey], ...]:
+    """Returns (label, ColumnKey) pairs sorted by label, cached per column set.
+
+    Table columns are fixed once composed, so repeated opens of the modal
+    for the same table reuse the same options instead of rebuilding them.
+    """
+    signature = tuple(columns)
+    options = _OPTIONS_CACHE.get(signature)
+    if options is not None:
+        return options
+
+    column_options: List[Tuple[str, ColumnKey]] = []
+    for col_key, column_obj in columns.items():
+        # Get column label safely, handling both Text and plain labels
+        label_obj = getattr(column_obj, 'label', None)
+        column_label = getattr(label_obj, 'plain', None) or (
+            str(label_obj) if label_obj is not None else "Unknown"
+        )
+        # Interned so tables sharing column names share one label string
+        column_options.append((sys.intern(column_label), col_key))
+
+    # Sort options alphabetically by label for user convenience
+    column_options.sort(key=lambda item: item[0])
+    options = tuple(column_options)
+
+    if len(_OPTIONS_CACHE) >= _OPTIONS_CACHE_SIZE:
+        _OPTIONS_CACHE.pop(next(iter(_OPTIONS_CACHE))) # Evict the oldest column set
+    _OPTIONS_CACHE[signature] = options
+    return options
 
 
 # Specify the return type for dismiss()
 class SortModal(ModalScreen[Union[ColumnKey, None]]):
     """Modal dialog for selecting a column to sort. Returns the selected ColumnKey or None."""
 
-    CSS = """
+    # Class-level only: Textual compiles CSS and bindings per class, never assign these on self
+    CSS: ClassVar[str] = """
     SortModal {
         align: center middle;
     }
@@ -55,11 +93,10 @@ class SortModal(ModalScreen[Union[ColumnKey, None]]):
     }
     """
 
-    BINDINGS = [
+    BINDINGS: ClassVar[List[Binding]] = [
         Binding("escape", "cancel_sort", "Cancel", show=False), # Changed action
     ]
 
-    # Remove parent_screen from __init__
     def __init__(
         self,
         columns: Dict[ColumnKey, object],
@@ -67,59 +104,54 @@ class SortModal(ModalScreen[Union[ColumnKey, None]]):
         **kwargs
     ) -> None:
         super().__init__(*args, **kwargs)
-        # Store column labels and their corresponding ColumnKey objects
-        self.column_options: List[Tuple[str, ColumnKey]] = []
-
-        for col_key, column_obj in columns.items():
-            # Get column label safely
-            column_label = "Unknown"
-            if hasattr(column_obj, 'label'):
-                # Ensure label is extracted correctly, handling potential Text objects
-                label_obj = column_obj.label
-                if hasattr(label_obj, 'plain'):
-                    column_label = label_obj.plain
-                else:
-                    column_label = str(label_obj) # Fallback to string conversion
-            self.column_options.append((column_label, col_key))
-
-        # Sort options alphabetically by label for user convenience
-        self.column_options.sort(key=lambda item: item[0])
+        # Column labels and their corresponding ColumnKey objects
+        self.column_options: Tuple[Tuple[str, ColumnKey], ...] = _column_options(columns)
 
-        log.info(f"SortModal initialized with {len(self.column_options)} column options.")
+        # Values are passed as arguments so nothing is formatted unless devtools is listening
+        log.debug("SortModal initialized with", len(self.column_options), "column options.")
 
 
     def compose(self) -> ComposeResult:
-        # Use Container instead of Vertical for more control if needed, but Vertical works
-        with Vertical(id="dialog"):
-            yield Label("Sort by which column?")
-            # Yield the ListView first
-            with ListView(id="sort-list"):
-                # Yield each ListItem as a child of the ListView
-                for label, key in self.column_options:
-                    item = ListItem(Label(label))
-                    # Store the actual ColumnKey object as a custom attribute on the ListItem
-                    item.sort_key = key
-                    yield item
-            # Consider adding a Cancel button or relying solely on Escape binding
-            # yield Button("Cancel", id="cancel", variant="default")
+        # Build the whole subtree up front and hand it over as one container
+        # Items follow column_options order, so the list index maps back to the key
+        items = [ListItem(Label(label)) for label, _ in self.column_options]
+        yield Vertical(
+            Label("Sort by which column?"),
+            ListView(*items, id="sort-list"),
+            id="dialog",
+        )
+
+
+    def on_screen_resume(self) -> None:
+        """Starts every open on the first column with the list focused.
+
+        The navigators install this modal and push it again for later sorts,
+        so the ListView would otherwise keep the previous open's highlight.
+        """
+        try:
+            sort_list = self.query_one("#sort-list", ListView)
+        except NoMatches:
+            return # Not composed yet; a fresh ListView already starts at the top
+        sort_list.index = 0
+        sort_list.focus()
 
 
     @on(ListView.Selected)
     def handle_selection(self, event: ListView.Selected) -> None:
         """Handle selection of a column from the ListView."""
-        selected_item = event.item
-        # Retrieve the stored ColumnKey from the selected ListItem
-        if hasattr(selected_item, 'sort_key'):
-            selected_key = selected_item.sort_key
-            log.info(f"ListView item selected. Dismissing SortModal with ColumnKey: {selected_key}")
+        index = event.list_view.index
+        # Look up the ColumnKey by the selected item's position in column_options
+        if index is not None and 0 <= index < len(self.column_options):
+            selected_key = self.column_options[index][1]
+            log.debug("ListView item selected. Dismissing SortModal with ColumnKey:", selected_key)
             self.dismiss(selected_key) # Dismiss with the selected ColumnKey
         else:
-            log.error("Selected ListItem missing 'sort_key' attribute.")
+            log.error(f"Selected ListView index {index} has no matching column option.")
             self.dismiss(None) # Dismiss with None on error
 
     # Action for the escape binding (remains the same)
     def action_cancel_sort(self) -> None:
         """Called when escape is pressed."""
-        log.info("SortModal cancelled via escape key.")
+        log.debug("SortModal cancelled via escape key.")
         self.dismiss(None)
 
@@ -0,0 +1,76 @@
+"""Sort key parsers for the navigator's DataTable columns.
+
+Each screen keeps its own column label -> parser map and resolves it to
+column keys once in compose with ``resolve_sort_parsers``.
+"""
+
+from rich.text import Text
+
+from textual import log
+
+
+def cell_text(cell_data) -> str:
+    """Returns the plain text of a DataTable cell (Text, str or int)."""
+    return cell_data.plain if isinstance(cell_data, Text) else str(cell_data)
+
+
+def parse_string(cell_data) -> str:
+    """Sort key for text columns."""
+    return cell_text(cell_data)
+
+
+# Glyph columns: ✔ / ✘ / - / ⚠
+_GLYPH_ORDER = {"✔": 1, "✘": -1, "⚠": -2} # Sort errors before fails
+
+
+def parse_glyph(cell_data) -> int:
+    """Sort key for pass/fail/error glyph columns; '-' sorts in the middle."""
+    return _GLYPH_ORDER.get(cell_text(cell_data), 0)
+
+
+# Cells that stand in for a missing or unreadable number
+_NUMBER_PLACEHOLDERS = frozenset({"-", "?", "ERR"})
+
+
+def parse_number(cell_data) -> float:
+    """Sort key for numeric columns, tolerating thousands separators.
+
+    Placeholders sort before every number.
+    """
+    plain_text = cell_text(cell_data).replace(',', '') # Remove commas
+    if plain_text in _NUMBER_PLACEHOLDERS:
+        return float('-inf')
+    try:
+        return float(plain_text)
+    except ValueError:
+        log.warning(f"Could not convert '{plain_text}' to float for sorting")
+        return float('-inf') # Sort errors consistently first
+
+
+def parse_time(cell_data) -> float:
+    """Sort key for HH:MM:SS columns, in seconds."""
+    time_str = cell_text(cell_data)
+    if time_str == "-":
+        return -1
+    # partition instead of split/map: no intermediate lists per cell;
+    # a missing or extra field leaves a non-integer piece and raises
+    hours, _, rest = time_str.partition(':')
+    minutes, _, seconds = rest.partition(':')
+    try:
+        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    except ValueError:
+        log.warning(f"Could not parse time string '{time_str}' for sorting")
+        return float('-inf')
+
+
+def resolve_sort_parsers(table, parsers: dict) -> dict:
+    """Maps each of the table's column keys to the parser for its label.
+
+    Columns missing from ``parsers`` sort as text. Column order and labels
+    are fixed once composed, so screens call this once and sorting does
+    no per-cell dispatch.
+    """
+    return {
+        key: parsers.get(cell_text(column.label), parse_string)
+        for key, column in table.columns.items()
+    }
@@ -1,8 +1,11 @@
 """Defines the StepScreen for browsing files within a task step."""
 
+from collections import OrderedDict
+import functools
+import os
 from pathlib import Path
-import subprocess
-import shutil # To find terminal emulator
+import threading
+from typing import Callable
 
 
 from textual.app import ComposeResult
@@ -10,11 +13,12 @@ from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
 from textual.screen import Screen
 from textual.widgets import DataTable, Header, Footer, TextArea, ContentSwitcher, Static # Removed Markdown
+from textual.widgets._data_table import RowKey
 from textual.binding import Binding
-from textual import log
-
-# Import the new screen we will create
-from geometor.seer_navigator.screens.trial_split_view_screen import TrialSplitViewScreen
+from textual.message import Message
+from textual.timer import Timer
+from textual.worker import get_current_worker
+from textual import log, work
 
 
 LANGUAGE_MAP = {
@@ -27,9 +31,86 @@ LANGUAGE_MAP = {
 }
 # DEFAULT_THEME = "" # Removed unused variable
 
+# Number of recently viewed files kept in memory for fast j/k revisits
+_FILE_CACHE_SIZE = 64
+# Seconds j/k input must settle before the file under the cursor is loaded
+_SELECTION_DEBOUNCE = 0.08
+# Seconds over which a burst of refresh requests is coalesced into one refresh
+_REFRESH_DEBOUNCE = 0.25
+# Bytes read from a file until 'L' is pressed; anything past this is cut off
+_MAX_READ_SIZE = 512 * 1024
+# Name endings of the files shown by the trial split view
+TRIAL_SUFFIXES = (".trial.json", "trials.json")
+# Loaded text longer than this is released when the placeholder is shown
+_RELEASE_TEXT_SIZE = 262_144
+
+# Terminal emulators tried in order by action_open_terminal
+TERMINAL_COMMANDS = (
+    "gnome-terminal",
+    "konsole",
+    "xfce4-terminal",
+    "lxterminal",
+    "mate-terminal",
+    "terminator",
+    "xterm",
+    # Add other common Linux terminals if needed
+)
+
+@functools.lru_cache(maxsize=1)
+def _find_terminal() -> tuple[str | None, bool]:
+    """Returns the terminal emulator to launch and whether macOS 'open' exists.
+
+    The PATH lookups run once per process, negative results included.
+    """
+    import shutil # To find terminal emulator
+    terminal_cmd = next((cmd for cmd in TERMINAL_COMMANDS if shutil.which(cmd)), None)
+    # 'open' is only needed when no Linux terminal was found
+    has_open = terminal_cmd is None and shutil.which("open") is not None
+    return terminal_cmd, has_open
+
+
+# (path, st_mtime_ns, st_size) -> decoded content, most recent last; shared by all
+# StepScreens so revisiting a step reuses earlier reads. Filled from load workers.
+_FILE_CACHE: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_read(path: Path, stat: os.stat_result, read_missing: bool = True) -> str | None:
+    """Returns the file's text, reading from disk only if it changed since it was cached.
+
+    With read_missing unset, a cache miss returns None instead of reading the file.
+    """
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _FILE_CACHE_LOCK:
+        content = _FILE_CACHE.get(key)
+        if content is not None:
+            _FILE_CACHE.move_to_end(key)
+            return content
+    if not read_missing:
+        return None
+
+    content = path.read_text()
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = content
+        if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+            _FILE_CACHE.pop(next(iter(_FILE_CACHE))) # Drop the least recently viewed file
+    return content
+
+
 class StepScreen(Screen):
     """Displays the files within a step folder and their content."""
 
+    class FileLoaded(Message):
+        """Posted by the load worker with a file's content, ready to display."""
+
+        def __init__(self, path: Path, content: str, language: str | None, loaded: bool, truncated: bool = False) -> None:
+            super().__init__()
+            self.path = path
+            self.content = content
+            self.language = language
+            self.loaded = loaded # False when content is an error message
+            self.truncated = truncated # True when content is only the head of a large file
+
     CSS = """
     Screen {
         layers: base overlay;
@@ -89,6 +170,7 @@ class StepScreen(Screen):
         Binding("h", "app.pop_screen", "Back", show=True),
         Binding("r", "open_terminal", "Open Terminal", show=True), 
         Binding("v", "view_trial_split", "View Trial Split", show=True), # Added binding
+        Binding("L", "load_full_file", "Load Full File", show=False),
         # REMOVED Binding("i", "view_images", "View Images", show=True),
         # Binding("[", "previous_sibling", "Previous Sibling", show=True), 
         # Binding("]", "next_sibling", "Next Sibling", show=True),     
@@ -106,15 +188,39 @@ class StepScreen(Screen):
         self.step_name = step_path.name
         self.task_name = task_path.name
         self.session_name = session_path.name
+        # Debounced j/k selection: the path to load and the timer that will load it
+        self._pending_path: Path | None = None
+        self._pending_timer: Timer | None = None
+        self._refresh_timer: Timer | None = None # Pending schedule_refresh
+        # LANGUAGE_MAP narrowed to what the TextArea can highlight, resolved once on mount
+        self._suffix_languages: dict[str, str | None] = {}
+        # Per-row names parallel to file_paths, rebuilt whenever file_paths changes
+        self._file_names: list[str] = []
+        self._name_to_index: dict[str, int] = {}
+        # path -> (display handler, TextArea language), classified once per listing
+        self._file_kinds: dict[Path, tuple[Callable[["StepScreen", Path], None], str | None]] = {}
+        # Large files currently shown truncated
+        self._truncated_paths: set[Path] = set()
+        # Step directory signature (see _dir_signature) when file_paths was last listed
+        self._dir_sig: tuple[int, int, int] | None = None
+        # File name -> table row, in display order; empty while a placeholder row is shown
+        self._row_keys: dict[str, RowKey] = {}
+        # File whose content the TextArea currently holds, None after errors or clearing
+        self._loaded_path: Path | None = None
+        self._loaded_size = 0 # Length of the text the TextArea holds
+        self._loaded_content: str | None = None # The string last given to load_text
 
     def compose(self) -> ComposeResult:
+        # Widgets used on every selection are kept as attributes instead of queried each time
         yield Header()
         with Horizontal():
             with Vertical(id="file-list-container"):
-                yield DataTable(id="file-list-table")
+                self._table = DataTable(id="file-list-table")
+                yield self._table
             with Vertical(id="file-content-container"):
-                with ContentSwitcher(initial="text-viewer"):
-                    yield TextArea.code_editor(
+                with ContentSwitcher(initial="text-viewer") as switcher:
+                    self._switcher = switcher
+                    self._text_viewer = TextArea.code_editor(
                         "",
                         read_only=True,
                         show_line_numbers=True,
@@ -122,8 +228,10 @@ class StepScreen(Screen):
                         #  theme=DEFAULT_THEME,
                         id="text-viewer" # ID for the TextArea
                     )
+                    yield self._text_viewer
                     # Removed TrialViewer from here
-                    yield Static("Select a file to view its content.", id="content-placeholder")
+                    self._placeholder = Static("Select a file to view its content.", id="content-placeholder")
+                    yield self._placeholder
 
         yield Footer()
 
@@ -131,14 +239,17 @@ class StepScreen(Screen):
         """Called when the screen is mounted."""
         self.title = f"{self.session_name} • {self.task_name} • {self.step_name}"
 
-        table = self.query_one(DataTable)
+        table = self._table
         table.cursor_type = "row"
-        table.add_column("Files", width=None) # Let width be automatic
+        table.add_column("Files", width=None, key="files") # Let width be automatic
+        # Resolved here so file loading workers never have to touch the DOM
+        self._suffix_languages = self._resolve_languages(self._text_viewer.available_languages)
 
         # List files in the step directory, sorted alphabetically
         try:
             # Filter for files only, ignore directories
-            self.file_paths = sorted([f for f in self.step_path.iterdir() if f.is_file()])
+            self._dir_sig = self._dir_signature()
+            self.file_paths = self._list_step_files()
         except FileNotFoundError:
             self.app.pop_screen() # Go back if path doesn't exist
             self.app.notify("Error: Step directory not found.", severity="error")
@@ -149,20 +260,109 @@ class StepScreen(Screen):
             self.app.notify(f"Error listing files: {e}", severity="error")
             return
 
+        self._populate_table(table)
+        if self.file_paths:
+            self.select_row_index(0)
+            table.focus() 
+
+    def watch_file_paths(self, file_paths: list[Path]) -> None:
+        """Names and classifies every listed file once, so selection is a dict lookup."""
+        self._file_names = [file_path.name for file_path in file_paths]
+        self._name_to_index = {name: index for index, name in enumerate(self._file_names)}
+        # Rebound in one step, so a load worker never sees a half-built dict
+        self._file_kinds = {file_path: self._classify(file_path.suffix.lower()) for file_path in file_paths}
+
+    def _classify(self, suffix: str) -> tuple[Callable[["StepScreen", Path], None], str | None]:
+        """Returns the display handler and TextArea language for a lower-cased suffix."""
+        # Trial files end in .json, so the suffix lookup covers them too
+        return self._SUFFIX_HANDLERS.get(suffix, StepScreen._display_text), self._suffix_languages.get(suffix)
+
+    def _kind_of(self, path: Path) -> tuple[Callable[["StepScreen", Path], None], str | None]:
+        """Returns the precomputed (handler, language) of a file, classifying unlisted ones."""
+        kind = self._file_kinds.get(path)
+        return kind if kind is not None else self._classify(path.suffix.lower())
+
+    def _populate_table(self, table: DataTable) -> None:
+        """Replaces every table row with file_paths, or a placeholder row if there are none."""
+        table.clear()
+        self._row_keys = {}
         if not self.file_paths:
             table.add_row("No files found.")
             # Disable table focus if empty? Or allow focus but handle selection gracefully.
-        else:
-            for file_path in self.file_paths:
-                table.add_row(file_path.name)
+            return
+        names = self._file_names
+        # One add_rows call so the table lays out once for all files
+        self._row_keys = dict(zip(names, table.add_rows([(name,) for name in names])))
+
+    def _sync_table_rows(self, table: DataTable) -> None:
+        """Brings the table in line with file_paths by removing and adding only changed rows."""
+        new_names = self._file_names
+        if new_names == list(self._row_keys):
+            return # Listing changed on disk but not in what we show
+        if not self._row_keys or not new_names:
+            self._populate_table(table) # Placeholder row involved, rebuild
+            return
 
-            self.select_row_index(0)
-            table.focus() 
+        new_name_set = set(new_names)
+        for name in [name for name in self._row_keys if name not in new_name_set]:
+            table.remove_row(self._row_keys.pop(name))
+        for name in new_names:
+            if name not in self._row_keys:
+                self._row_keys[name] = table.add_row(name) # Appended; placed by the sort below
+        if list(self._row_keys) != new_names:
+            table.sort("files")
+            self._row_keys = {name: self._row_keys[name] for name in new_names}
+
+    def _cancel_pending_selection(self) -> None:
+        """Drops a debounced selection that has not been loaded yet."""
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+            self._pending_timer = None
+
+    def _schedule_row_index(self, index: int) -> None:
+        """Moves the cursor immediately but defers loading until j/k input settles."""
+        if not 0 <= index < len(self.file_paths):
+            return
+        table = self._table
+        if table.cursor_row != index:
+            table.move_cursor(row=index, animate=False)
+        self._pending_path = self.file_paths[index]
+        self._cancel_pending_selection() # Restart the wait on every keypress
+        # A read still running for a row the cursor has left is wasted work
+        self.workers.cancel_group(self, "file-load")
+        self._pending_timer = self.set_timer(_SELECTION_DEBOUNCE, self._commit_selection)
+
+    def _commit_selection(self) -> None:
+        """Loads the row the cursor landed on; fires the selected_file_path watch."""
+        self._pending_timer = None
+        self.selected_file_path = self._pending_path
+
+    def _dir_signature(self) -> tuple[int, int, int]:
+        """Returns (inode, mtime, size) of the step directory; changes when entries do.
+
+        The inode catches a step directory that was deleted and recreated with
+        the same name within the filesystem's mtime resolution.
+        """
+        stat = self.step_path.stat()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _list_step_files(self, endings: tuple[str, ...] = ()) -> list[Path]:
+        """Returns the step's files sorted by path, optionally only names ending in one of endings."""
+        # DirEntry.is_file() answers from the directory listing, no per-file stat
+        with os.scandir(self.step_path) as entries:
+            # Sort the plain path strings (same parent, so this is name order) and only
+            # then wrap them; comparing Path objects re-splits their parts on every compare
+            file_names = sorted(
+                entry.path for entry in entries
+                if (not endings or entry.name.endswith(endings)) and entry.is_file()
+            )
+        return [Path(file_name) for file_name in file_names]
 
     def select_row_index(self, index: int):
         """Selects a row by index and triggers loading/display logic."""
+        self._cancel_pending_selection() # An immediate selection supersedes a pending one
         if 0 <= index < len(self.file_paths):
-            table = self.query_one(DataTable)
+            table = self._table
             # Check if cursor is already at the target row to avoid unnecessary updates
             if table.cursor_row != index:
                 table.move_cursor(row=index, animate=False)
@@ -171,124 +371,188 @@ class StepScreen(Screen):
         else:
             self.selected_file_path = None # Clear selection if index is out of bounds
 
+    @staticmethod
+    def _resolve_languages(available_languages) -> dict[str, str | None]:
+        """Returns LANGUAGE_MAP with languages the TextArea cannot highlight mapped to None."""
+        suffix_languages = {}
+        for suffix, language in LANGUAGE_MAP.items():
+            # Check if language requires the 'syntax' extra for TextArea
+            if language and language not in available_languages:
+                log.warning(f"Language '{language}' for {suffix} files not available in TextArea. Install 'textual[syntax]' for highlighting.")
+                language = None # Fallback for TextArea
+            suffix_languages[suffix] = language
+        return suffix_languages
+
+    def _load_and_classify(self, path: Path, full: bool = False) -> tuple[str, str | None, bool]:
+        """Returns (content, language, truncated) for a file, served from cache when unchanged on disk.
+
+        Files over _MAX_READ_SIZE are cut to their first _MAX_READ_SIZE bytes
+        unless full is set; truncated reads are not cached. Runs on the load
+        worker thread, so it leaves screen state alone.
+        """
+        stat = path.stat()
+        language = self._kind_of(path)[1]
+        if not full and stat.st_size > _MAX_READ_SIZE:
+            content = _cached_read(path, stat, read_missing=False)
+            if content is not None:
+                return content, language, False # Already loaded in full earlier
+            with open(path, "rb") as f:
+                head = f.read(_MAX_READ_SIZE).decode("utf-8", errors="replace")
+            return f"{head}\n\n... [truncated {stat.st_size - _MAX_READ_SIZE} bytes, press L to load full file]", language, True
+
+        return _cached_read(path, stat), language, False
+
+    @work(thread=True, exclusive=True, group="file-load")
+    def _load_file_worker(self, path: Path, full: bool = False) -> None:
+        """Reads and classifies a file off the UI thread, then hands it back to the screen."""
+        try:
+            content, language, truncated = self._load_and_classify(path, full)
+            loaded = True
+        except Exception as e:
+            log.error(f"Error loading file {path}: {e}")
+            # Display error in TextArea
+            content, language, loaded, truncated = f"Error loading file:\n\n{e}", None, False, False
+        if get_current_worker().is_cancelled:
+            return # Selection moved on while this file was being read
+        # post_message is thread safe and, unlike call_from_thread, does not block
+        # this worker until the UI has finished applying the content
+        self.post_message(self.FileLoaded(path, content, language, loaded, truncated))
+
+    def on_step_screen_file_loaded(self, message: FileLoaded) -> None:
+        """Applies content delivered by _load_file_worker on the UI thread."""
+        # Only updated here, so action_load_full_file never sees the worker mid-change
+        if message.truncated:
+            self._truncated_paths.add(message.path)
+        else:
+            self._truncated_paths.discard(message.path)
+        self._apply_loaded_content(message.path, message.content, message.language, message.loaded)
+
+    def _apply_loaded_content(self, path: Path, content: str, language: str | None, loaded: bool = True) -> None:
+        """Shows content read by _load_file_worker, unless the selection has changed since."""
+        if path != self.selected_file_path:
+            return # Stale result for a file that is no longer selected
+        self._loaded_path = path if loaded else None
+        switcher = self._switcher
+        text_viewer = self._text_viewer
+        # Skip rebuilding the document for text it already holds. str equality checks
+        # identity (cached reads return the same object) and length before comparing
+        # bytes, so this also catches re-reads of identical content after cache eviction
+        if content != self._loaded_content:
+            # Load text first, then set language for TextArea
+            text_viewer.load_text(content)
+            self._loaded_content = content
+            self._loaded_size = len(content)
+        if text_viewer.language != language:
+            text_viewer.language = language # Only switch parsers when the language changes
+        switcher.current = "text-viewer"
+        text_viewer.scroll_home(animate=False) # Scroll TextArea to top
+
+    def _switch_to_placeholder(self, message: str, release_text: bool = True) -> None:
+        """Shows message in the placeholder, optionally releasing the TextArea's document."""
+        text_viewer = self._text_viewer
+        if release_text and self._loaded_size:
+            text_viewer.load_text("")
+            self._loaded_path = None
+            self._loaded_content = None
+            self._loaded_size = 0
+            if text_viewer.language is not None:
+                text_viewer.language = None
+        self._placeholder.update(message)
+        self._switcher.current = "content-placeholder"
+
+    def _show_png_placeholder(self, path: Path) -> None:
+        """Shows a placeholder for PNG files, which the TextArea cannot display."""
+        # Small files stay loaded so stepping back to them is instant; large ones are freed
+        self._switch_to_placeholder(
+            f"Selected: '{path.name}' (PNG)\n\nPress 'i' to view images (if available).", # Updated placeholder text
+            release_text=self._loaded_size > _RELEASE_TEXT_SIZE,
+        )
+
+    def _display_text(self, path: Path) -> None:
+        """Shows text/code files, including trial JSON and Markdown, in the TextArea."""
+        if path == self._loaded_path:
+            # Still in the TextArea (e.g. back from a PNG row); skip reloading and re-highlighting
+            self._switcher.current = "text-viewer"
+            self._text_viewer.scroll_home(animate=False)
+            return
+        # Read in a worker; a newer selection cancels any in-flight read
+        self._load_file_worker(path)
+
+    # Suffix -> display handler; anything not listed is shown as text
+    _SUFFIX_HANDLERS = {
+        ".png": _show_png_placeholder,
+    }
+
     # Watch for changes in selected_file_path and update the appropriate viewer
     def watch_selected_file_path(self, old_path: Path | None, new_path: Path | None) -> None:
         """Called when selected_file_path changes. Updates the content viewer."""
-        switcher = self.query_one(ContentSwitcher)
-        text_viewer = self.query_one("#text-viewer", TextArea)
-        placeholder = self.query_one("#content-placeholder", Static)
-
         if new_path:
-            file_suffix = new_path.suffix.lower()
-            file_name = new_path.name
-
-            # Check if it's a trial file - treat like other text files now
-            # The special handling is moved to action_view_trial_split
-            if file_name.endswith("trial.json") or file_name.endswith("trials.json"):
-                log.info(f"Displaying JSON content for: {new_path}")
-                try:
-                    content = new_path.read_text()
-                    text_viewer.load_text(content)
-                    text_viewer.language = "json" # Set language to JSON
-                    switcher.current = "text-viewer"
-                    text_viewer.scroll_home(animate=False)
-                except Exception as e:
-                    log.error(f"Error loading trial JSON file {new_path}: {e}")
-                    error_content = f"Error loading file:\n\n{e}"
-                    text_viewer.load_text(error_content)
-                    text_viewer.language = None
-                    switcher.current = "text-viewer"
-
-            elif file_suffix == ".png":
-                # Handle PNG files - show placeholder
-                placeholder.update(f"Selected: '{new_path.name}' (PNG)\n\nPress 'i' to view images (if available).") # Updated placeholder text
-                switcher.current = "content-placeholder"
-
-            elif file_suffix == ".md":
-                # Handle Markdown files using TextArea
-                try:
-                    content = new_path.read_text()
-                    # Load into TextArea and set language
-                    text_viewer.load_text(content)
-                    text_viewer.language = "markdown"
-                    switcher.current = "text-viewer"
-                    text_viewer.scroll_home(animate=False) # Scroll TextArea to top
-                except Exception as e:
-                    log.error(f"Error loading Markdown file {new_path}: {e}")
-                    # Display error in TextArea (fallback)
-                    error_content = f"Error loading file:\n\n{e}"
-                    text_viewer.load_text(error_content)
-                    text_viewer.language = None
-                    switcher.current = "text-viewer"
-
-            else:
-                # Handle other text/code files
-                try:
-                    content = new_path.read_text()
-                    language = LANGUAGE_MAP.get(file_suffix)
-
-                    # Check if language requires the 'syntax' extra for TextArea
-                    if language and language not in text_viewer.available_languages:
-                         log.warning(f"Language '{language}' for {new_path.name} not available in TextArea. Install 'textual[syntax]' for highlighting.")
-                         language = None # Fallback for TextArea
-
-                    # Load text first, then set language for TextArea
-                    text_viewer.load_text(content)
-                    text_viewer.language = language
-                    switcher.current = "text-viewer"
-                    text_viewer.scroll_home(animate=False) # Scroll TextArea to top
-                except Exception as e:
-                    log.error(f"Error loading file {new_path}: {e}")
-                    # Display error in TextArea
-                    error_content = f"Error loading file:\n\n{e}"
-                    text_viewer.load_text(error_content)
-                    text_viewer.language = None
-                    switcher.current = "text-viewer"
-
+            handler, _ = self._kind_of(new_path)
+            handler(self, new_path)
         else:
             # Clear viewer if no file is selected
-            text_viewer.load_text("")
-            text_viewer.language = None
-            placeholder.update("No file selected.") # Reset placeholder
-            # Switch to placeholder when nothing is selected
-            switcher.current = "content-placeholder"
+            self._switch_to_placeholder("No file selected.") # Reset placeholder
 
 
     def action_cursor_down(self) -> None:
         """Move the cursor down in the DataTable."""
-        table = self.query_one(DataTable)
+        table = self._table
         current_row = table.cursor_row
         next_row = min(len(self.file_paths) - 1, current_row + 1)
-        self.select_row_index(next_row) # Use select_row_index to trigger watch
+        self._schedule_row_index(next_row) # Load once the cursor settles
 
     def action_cursor_up(self) -> None:
         """Move the cursor up in the DataTable."""
-        table = self.query_one(DataTable)
+        table = self._table
         current_row = table.cursor_row
         prev_row = max(0, current_row - 1)
-        self.select_row_index(prev_row) # Use select_row_index to trigger watch
+        self._schedule_row_index(prev_row) # Load once the cursor settles
+
+    def _reload_selected_file(self) -> None:
+        """Re-reads the selected file from disk without changing the selection."""
+        path = self.selected_file_path
+        if path and self._kind_of(path)[0] is StepScreen._display_text:
+            self._load_file_worker(path)
 
     def action_select_file(self) -> None:
         """Action triggered by pressing Enter on the table."""
-        # The watch_selected_file_path handles pushing TrialScreen or updating viewers.
-        # This action might be useful if we want Enter to *always* try to open/view,
-        # even if the selection hasn't changed, but for now, it's implicitly handled.
-        # We could force a re-evaluation if needed:
-        current_path = self.selected_file_path
-        if current_path:
-             # Temporarily set to None and back to force the watch method
-             # This ensures the watch method runs even if the selection didn't change visually
-             self.selected_file_path = None
-             self.selected_file_path = current_path
-        pass # Corrected indentation
+        if self._pending_timer is not None:
+            # Enter during a j/k burst loads the row under the cursor right away
+            self._cancel_pending_selection()
+            self._commit_selection()
+            return
+        # Re-show the selection without going through the reactive: a file the TextArea
+        # already holds just returns to its top, anything else (e.g. after a failed
+        # read) is re-applied, from the content cache when possible
+        path = self.selected_file_path
+        if path:
+            handler, _ = self._kind_of(path)
+            handler(self, path)
+
+    def action_load_full_file(self) -> None:
+        """Reloads the selected file without truncation."""
+        path = self.selected_file_path
+        if path is None or path not in self._truncated_paths:
+            self.app.notify("Current file is already fully loaded.")
+            return
+        log.info(f"Loading full content of {path}")
+        self._load_file_worker(path, full=True)
 
     def action_view_trial_split(self) -> None:
         """Finds all trial files in the current step and pushes TrialSplitViewScreen."""
+        # Imported on first use; most visits to a step never open the split view
+        from geometor.seer_navigator.screens.trial_split_view_screen import TrialSplitViewScreen
+
         try:
-            trial_files = sorted([
-                f for f in self.step_path.iterdir()
-                if f.is_file() and (f.name.endswith(".trial.json") or f.name.endswith("trials.json"))
-            ])
+            if self._dir_signature() == self._dir_sig:
+                # Listing is still current, filter it instead of scanning again
+                trial_files = [
+                    file_path for file_path, name in zip(self.file_paths, self._file_names)
+                    if name.endswith(TRIAL_SUFFIXES)
+                ]
+            else:
+                # Names are filtered before any Path is built for the entry
+                trial_files = self._list_step_files(TRIAL_SUFFIXES)
 
             if not trial_files:
                 self.app.notify("No '.trial.json' files found in this step.", severity="warning")
@@ -311,29 +575,26 @@ class StepScreen(Screen):
 
     def action_open_terminal(self) -> None:
         """Opens a new terminal window in the current step directory."""
-        # Corrected indentation for the whole method body
-        terminal_commands = [
-            "gnome-terminal",
-            "konsole",
-             "xfce4-terminal",
-             "lxterminal",
-             "mate-terminal",
-             "terminator",
-             "xterm",
-             # Add other common Linux terminals if needed
-        ]
-        terminal_cmd = None
-        for cmd in terminal_commands:
-            if shutil.which(cmd):
-                terminal_cmd = cmd
-                break
+        import subprocess
+
+        terminal_cmd, has_open = _find_terminal()
+        # Detached from our session and TTY so the child neither scribbles over the TUI nor
+        # gets SIGHUP when we exit; Python fds are non-inheritable, so skip the close_fds scan
+        popen_kwargs = dict(
+            cwd=self.step_path,
+            close_fds=False,
+            start_new_session=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
         if not terminal_cmd:
             # Basic fallback for macOS (might need refinement)
-            if shutil.which("open"):
+            if has_open:
                  try:
                      # Use 'open -a Terminal .' which should open Terminal.app at the CWD
-                     subprocess.Popen(["open", "-a", "Terminal", "."], cwd=self.step_path)
+                     subprocess.Popen(["open", "-a", "Terminal", "."], **popen_kwargs)
                      log.info(f"Opened macOS Terminal in {self.step_path}")
                      return # Success
                  except Exception as e:
@@ -348,7 +609,7 @@ class StepScreen(Screen):
             log.info(f"Opening terminal '{terminal_cmd}' in {self.step_path}")
             # Most terminals accept --working-directory= or similar, but launching
             # with cwd set in Popen is more reliable across different terminals.
-            subprocess.Popen([terminal_cmd], cwd=self.step_path)
+            subprocess.Popen([terminal_cmd], **popen_kwargs)
         except Exception as e:
             log.error(f"Failed to open terminal {terminal_cmd}: {e}")
             self.app.notify(f"Failed to open terminal: {e}", severity="error")
@@ -367,41 +628,57 @@ class StepScreen(Screen):
         else:
             self.selected_file_path = None # Clear if selection is invalid
 
+    def schedule_refresh(self) -> None:
+        """Requests a refresh_content; requests arriving in quick succession run it once."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(_REFRESH_DEBOUNCE, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        """Timer callback for schedule_refresh."""
+        self._refresh_timer = None
+        self.refresh_content()
+        self.notify("Screen refreshed")
+
     def refresh_content(self) -> None:
         """Reloads the file list and the content of the selected file."""
         log.info(f"Refreshing StepScreen content for {self.step_path.name}...")
-        table = self.query_one(DataTable)
+        table = self._table
         current_cursor_row = table.cursor_row
         previously_selected_filename = self.selected_file_path.name if self.selected_file_path else None
+        self._loaded_path = None
+        self._truncated_paths.clear()
 
-        # Re-list files
+        # Re-list files, unless no entry was added, removed or renamed since the last listing
         try:
-                self.file_paths = sorted([f for f in self.step_path.iterdir() if f.is_file()])
+            dir_sig = self._dir_signature()
+            if dir_sig == self._dir_sig:
+                log.info(f"File list for {self.step_path.name} unchanged; reloading selected file only.")
+                self._reload_selected_file() # Re-render the current row from disk
+                table.focus()
+                return
+            self.file_paths = self._list_step_files()
+            self._dir_sig = dir_sig
         except Exception as e:
             log.error(f"Error re-listing files in {self.step_path}: {e}")
             self.app.notify(f"Error refreshing file list: {e}", severity="error")
             # Optionally clear table or show error state
             table.clear()
+            self._row_keys = {}
             table.add_row("Error refreshing list.")
             self.selected_file_path = None # Clear selection
             return
 
-        # Clear and repopulate table
-        table.clear()
+        # Update only the rows that changed; unchanged rows and the cursor stay put
+        with self.app.batch_update(): # No intermediate repaint while rows change
+            self._sync_table_rows(table)
+
         if not self.file_paths:
-            table.add_row("No files found.")
             self.selected_file_path = None # Clear selection
         else:
-            for file_path in self.file_paths:
-                table.add_row(file_path.name)
-
             # Try to re-select the previously selected file by name
-            new_index = -1
-            if previously_selected_filename:
-                try:
-                    new_index = [f.name for f in self.file_paths].index(previously_selected_filename)
-                except ValueError:
-                    new_index = -1 # File no longer exists
+            # -1 when nothing was selected or the file no longer exists
+            new_index = self._name_to_index.get(previously_selected_filename, -1)
 
             # Select the found index, or the previous row index if valid, or the first row
             if new_index != -1:
@@ -411,4 +688,7 @@ class StepScreen(Screen):
             else:
                 self.select_row_index(0) # Fallback to first item
 
+            if self.selected_file_path is not None and self.selected_file_path.name == previously_selected_filename:
+                self._reload_selected_file() # Same file kept, so the watch did not re-read it
+
         table.focus() # Ensure table has focus
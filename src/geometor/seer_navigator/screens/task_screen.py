@@ -1,5 +1,6 @@
 """Defines the TaskScreen for displaying steps and summary of a single task."""
 
+import os
 import re
 from rich.text import Text
 from datetime import timedelta # Import timedelta
@@ -15,7 +16,7 @@ from textual.containers import (
     ScrollableContainer,
 )
 from textual.binding import Binding
-from textual.widgets._data_table import ColumnKey # ADDED ColumnKey
+from textual.widgets._data_table import ColumnKey, RowKey # ADDED ColumnKey
 from textual import log # ADDED import
 # REMOVED subprocess import
 # REMOVED shutil import
@@ -23,12 +24,135 @@ from textual import log # ADDED import
 from pathlib import Path
 import json
 
-from geometor.seer.session.level import Level  # Import Level
-from geometor.seer_navigator.screens.step_screen import StepScreen # IMPORT THE NEW SCREEN
+from geometor.seer_navigator.screens.common import (
+    BOOL_MAP,
+    CROSS,
+    DASH_CENTER,
+    ROW_WINDOW,
+    TICK,
+    WARN,
+    format_seconds,
+    load_json,
+    mtime_ns,
+    read_concurrently,
+    rows_to_load,
+    text_right,
+)
+from geometor.seer_navigator.screens.step_screen import StepScreen, TRIAL_SUFFIXES # IMPORT THE NEW SCREEN
+from geometor.seer_navigator.screens.sort_parsers import (
+    cell_text,
+    parse_string,
+    parse_glyph,
+    parse_number,
+    parse_time,
+    resolve_sort_parsers,
+)
 # Import the trial split view screen
 from geometor.seer_navigator.screens.trial_split_view_screen import TrialSplitViewScreen
 
 
+def _count_files(step_dir: Path) -> int:
+    """Counts the regular files in a step directory.
+
+    DirEntry.is_file answers from the readdir entry type, so no extra stat
+    per entry and no Path objects are created.
+    """
+    with os.scandir(step_dir) as entries:
+        return sum(1 for entry in entries if entry.is_file())
+
+
+def _load_step_summary(step_dir: Path) -> dict | None:
+    """Loads a step's index.json, or None if it is missing or invalid."""
+    try:
+        return load_json(step_dir / "index.json")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _read_step(step_dir: Path, previous: tuple[int, dict | None] | None = None) -> tuple[int | None, dict | None, int | None]:
+    """Reads a step's index.json mtime, summary and file count.
+
+    ``previous`` is the cached (mtime, summary) pair; when index.json has
+    the same mtime it is reused instead of re-parsed. The file count is
+    always re-taken since files can appear without index.json changing.
+    """
+    try:
+        num_files = _count_files(step_dir)
+    except FileNotFoundError:
+        num_files = None
+    try:
+        mtime = (step_dir / "index.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        return None, None, num_files
+    if previous is not None and previous[0] == mtime:
+        return mtime, previous[1], num_files
+    return mtime, _load_step_summary(step_dir), num_files
+
+
+def list_step_dirs(task_path: Path) -> list[Path]:
+    """Returns a task's step directories sorted by name.
+
+    DirEntry.is_dir answers from the readdir entry type, so no stat per
+    entry is needed (symlinks are still followed).
+    """
+    with os.scandir(task_path) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_dir())
+    return [task_path / name for name in names]
+
+
+def _task_fingerprint(task_path: Path, step_dirs: list[Path]) -> tuple:
+    """Stat-only fingerprint of everything the task screen displays.
+
+    Covers the task's index.json, each step directory (its mtime moves
+    when files are added or removed, which changes FILES) and each step's
+    index.json.
+    """
+    return (
+        mtime_ns(task_path / "index.json"),
+        tuple(
+            (step_dir.name, mtime_ns(step_dir), mtime_ns(step_dir / "index.json"))
+            for step_dir in step_dirs
+        ),
+    )
+
+
+# Placeholder cells after STEP for steps without a readable summary (15 of 16 columns)
+_DASH_CELLS = ("-",) * 15
+
+# Shared read-only default for summaries without a "response" section
+_EMPTY: dict = {}
+
+# Leading step number in names like "001_code"
+_STEP_NUM_RE = re.compile(r"(\d+)")
+
+
+def _parse_step(cell_data) -> int:
+    """Sort key for the STEP column: the leading step number."""
+    match = _STEP_NUM_RE.match(cell_text(cell_data))
+    return int(match.group(1)) if match else -1
+
+
+# Sort key parser for each main table column, keyed by column label
+SORT_PARSERS = {
+    "STEP": _parse_step,
+    "ERROR": parse_glyph,
+    "TEST": parse_glyph,
+    "TRAIN": parse_glyph,
+    "SIZE": parse_glyph,
+    "PALETTE": parse_glyph,
+    "COLORS": parse_glyph,
+    "SCORE": parse_number,
+    "PIXELS": parse_number,
+    "%": parse_number,
+    "ATTEMPTS": parse_number,
+    "IN": parse_number,
+    "OUT": parse_number,
+    "TOTAL": parse_number,
+    "FILES": parse_number,
+    "TIME": parse_time,
+}
+
+
 class TaskScreen(Screen):
     CSS = """
     Screen > Vertical {
@@ -76,13 +200,24 @@ class TaskScreen(Screen):
         # REMOVED sxiv check state attributes
         self.current_sort_key: ColumnKey | None = None # ADDED sort state
         self.current_sort_reverse: bool = False      # ADDED sort state
+        # Parsed index.json per step, shared by load_steps and update_summary
+        self._step_summaries: dict[Path, dict | None] = {}
+        self._file_counts: dict[Path, int | None] = {}
+        self._summary_mtimes: dict[Path, int | None] = {}
+        # Formatted row per step, keyed on the (index.json mtime, file count) it was built from
+        self._row_cache: dict[Path, tuple[int | None, int | None, tuple]] = {}
+        # Formatted rows for every step; only the first _loaded_rows are in the table
+        self._all_rows: list[tuple] = []
+        self._loaded_rows = 0
+        self._row_keys: dict[str, RowKey] = {} # Step name -> row key, for loaded rows
+        self._fingerprint: tuple | None = None # Last displayed _task_fingerprint
 
     # REMOVED _check_sxiv method
 
     def compose(self) -> ComposeResult:
         self.table = DataTable() # Main steps table
         # Add columns in the new requested order, including ERROR
-        self.table.add_columns(
+        self._col_keys: list[ColumnKey] = self.table.add_columns(
             "STEP",
             Text("ERROR", justify="center"),     # ADDED
             "TEST",
@@ -100,6 +235,9 @@ class TaskScreen(Screen):
             Text("TOTAL", justify="right"),
             "FILES",
         )
+        # Column order is fixed from here on; resolve each column's position and sort parser once
+        self._col_index = {key: index for index, key in enumerate(self._col_keys)}
+        self._sort_parsers = resolve_sort_parsers(self.table, SORT_PARSERS)
         self.table.cursor_type = "row"
 
         yield Header()
@@ -124,141 +262,167 @@ class TaskScreen(Screen):
         tokens_table = self.query_one("#tokens-table", DataTable)
         tokens_table.add_columns("Metric", "Value")
 
+        self._fingerprint = _task_fingerprint(self.task_path, self.step_dirs)
+        self._load_summaries()
         self.load_steps() # Load main table data
         self.table.cursor_type = "row"
         self.table.focus()
-        self.update_summary() # Populate summary tables
+        # Summary grid fills in after the steps table is first painted; it
+        # aggregates the cached summaries, so no files are read again
+        self.call_after_refresh(self.update_summary)
         # Add sort key tracking
         self.current_sort_key = None
         self.current_sort_reverse = False
 
+    def _load_summaries(self) -> None:
+        """Reads every step's index.json and file count once into the cache.
+
+        Steps are read concurrently to overlap disk latency; the table itself
+        is only touched afterwards, on the main thread. Summaries whose
+        index.json mtime is unchanged since the last read are kept as is.
+        """
+        previous = {
+            step_dir: (mtime, self._step_summaries.get(step_dir))
+            for step_dir, mtime in self._summary_mtimes.items()
+            if mtime is not None
+        }
+        self._step_summaries = {}
+        self._file_counts = {}
+        self._summary_mtimes = {}
+        if not self.step_dirs:
+            return
+        results = read_concurrently(
+            lambda step_dir: _read_step(step_dir, previous.get(step_dir)), self.step_dirs
+        )
+        for step_dir, result in zip(self.step_dirs, results):
+            mtime, summary, num_files = result.result()
+            self._summary_mtimes[step_dir] = mtime
+            self._step_summaries[step_dir] = summary
+            self._file_counts[step_dir] = num_files
+        # Forget rows of steps that no longer exist
+        self._row_cache = {
+            step_dir: entry for step_dir, entry in self._row_cache.items()
+            if step_dir in self._step_summaries
+        }
+
+    def _format_row(self, step_dir: Path) -> tuple:
+        """Returns the 16 steps-table cells for a step, reusing the last row
+        built for it while its index.json mtime and file count are unchanged."""
+        mtime = self._summary_mtimes.get(step_dir)
+        num_files = self._file_counts.get(step_dir)
+        cached = self._row_cache.get(step_dir)
+        if cached is not None and mtime is not None and cached[:2] == (mtime, num_files):
+            return cached[2]
+        row = self._build_row(step_dir, num_files)
+        self._row_cache[step_dir] = (mtime, num_files, row)
+        return row
+
+    def _build_row(self, step_dir: Path, num_files: int | None) -> tuple:
+        """Builds the 16 steps-table cells for a step from the cached summary."""
+        summary = self._step_summaries.get(step_dir)
+        if summary is None or num_files is None:
+            # Missing/invalid index.json or vanished directory (16 columns)
+            return (step_dir.name, *_DASH_CELLS)
+
+        # Use the updated _format_duration method
+        time_str = (
+            format_seconds(int(summary["duration_seconds"]))
+            if summary.get("duration_seconds") is not None
+            else "-"
+        )
+
+        # --- START ERROR HANDLING ---
+        has_errors = summary.get("has_errors", False) # Default to False if missing
+        error_text = WARN if has_errors else DASH_CENTER
+        # --- END ERROR HANDLING ---
+
+        # --- START RETRIES HANDLING ---
+        attempts = summary.get("attempts")
+        attempts_text = text_right("-" if attempts is None else str(attempts))
+        # --- END RETRIES HANDLING ---
+
+        # --- START TOKEN HANDLING ---
+        response = summary.get("response") or _EMPTY
+        prompt_tokens = response.get("prompt_tokens")
+        candidates_tokens = response.get("candidates_tokens")
+        total_tokens = response.get("total_tokens")
+
+        in_tokens_text = text_right("-" if prompt_tokens is None else str(prompt_tokens))
+        out_tokens_text = text_right("-" if candidates_tokens is None else str(candidates_tokens))
+        total_tokens_text = text_right("-" if total_tokens is None else str(total_tokens))
+        # --- END TOKEN HANDLING ---
+
+        # --- START PASS/FAIL HANDLING ---
+        if "train_passed" in summary: # Check if key exists
+            train_passed = TICK if summary["train_passed"] else CROSS
+        else:
+            # Default if key is missing
+            train_passed = DASH_CENTER
+
+        if "test_passed" in summary: # Check if key exists
+            test_passed = TICK if summary["test_passed"] else CROSS
+        else:
+            # Default if key is missing
+            test_passed = DASH_CENTER
+        # --- END PASS/FAIL HANDLING ---
+
+        # --- START BEST SCORE HANDLING ---
+        best_score_text = (
+            f"{summary.get('best_score'):.2f}"
+            if summary.get("best_score") is not None
+            else "-"
+        )
+        best_score_text = text_right(best_score_text)
+        # --- END BEST SCORE HANDLING ---
+
+        # --- START BEST TRIAL METRICS HANDLING ---
+        # Read metrics directly from the summary dictionary
+        # metrics = summary.get("best_trial_metrics", {}) # REMOVED - Read directly
+
+        # Use the correct top-level keys from the summary
+        size_correct_text = BOOL_MAP.get(summary.get("size_correct"), DASH_CENTER)
+        palette_correct_text = BOOL_MAP.get(summary.get("color_palette_correct"), DASH_CENTER)
+        color_count_correct_text = BOOL_MAP.get(summary.get("color_count_correct"), DASH_CENTER)
+
+        # Get TOTAL pixels off count directly from summary
+        pixels_off_val = summary.get("pixels_off")
+        # Format as integer string
+        pixels_off_text = text_right("-" if pixels_off_val is None else str(pixels_off_val))
+
+        # Get percent correct directly from summary
+        percent_correct_val = summary.get("percent_correct")
+        percent_correct_text = text_right("-" if percent_correct_val is None else f"{percent_correct_val:.1f}")
+        # --- END BEST TRIAL METRICS HANDLING ---
+
+
+        # Add the row with arguments in the new order (16 columns total)
+        return (
+            step_dir.name,             # STEP
+            error_text,                # ERROR
+            test_passed,               # TEST
+            train_passed,              # TRAIN
+            best_score_text,           # SCORE
+            size_correct_text,         # SIZE
+            palette_correct_text,      # PALETTE
+            color_count_correct_text,  # COLORS
+            pixels_off_text,           # PIXELS
+            percent_correct_text,      # %
+            time_str,                  # TIME
+            attempts_text,             # ATTEMPTS
+            in_tokens_text,            # IN
+            out_tokens_text,           # OUT
+            total_tokens_text,         # TOTAL
+            num_files                  # FILES
+        )
+
     def load_steps(self):
         """Loads data into the main steps DataTable."""
         self.table.clear()  # Clear before adding
-        for step_dir in self.step_dirs:  # Use self.step_dirs
-            summary_path = step_dir / "index.json"
-            try:
-                with open(summary_path, "r") as f:
-                    summary = json.load(f)
-                num_files = sum(1 for item in step_dir.iterdir() if item.is_file()) # Count only files
-
-                # Use the updated _format_duration method
-                time_str = (
-                    Level._format_duration(summary.get("duration_seconds"))
-                    if summary.get("duration_seconds") is not None
-                    else "-"
-                )
-
-                # --- START ERROR HANDLING ---
-                has_errors = summary.get("has_errors", False) # Default to False if missing
-                error_text = (
-                    Text("⚠", style="bold #FFD700", justify="center") # CHANGED character and style
-                    if has_errors
-                    else Text("-", justify="center")
-                )
-                # --- END ERROR HANDLING ---
-
-                # --- START RETRIES HANDLING ---
-                attempts = summary.get("attempts")
-                attempts_text = Text(str(attempts) if attempts is not None else "-", justify="right")
-                # --- END RETRIES HANDLING ---
-
-                # --- START TOKEN HANDLING ---
-                prompt_tokens = summary.get("response", {}).get("prompt_tokens")
-                candidates_tokens = summary.get("response", {}).get("candidates_tokens")
-                total_tokens = summary.get("response", {}).get("total_tokens")
-
-                in_tokens_text = Text(str(prompt_tokens) if prompt_tokens is not None else "-", justify="right")
-                out_tokens_text = Text(str(candidates_tokens) if candidates_tokens is not None else "-", justify="right")
-                total_tokens_text = Text(str(total_tokens) if total_tokens is not None else "-", justify="right")
-                # --- END TOKEN HANDLING ---
-
-                # --- START PASS/FAIL HANDLING ---
-                if "train_passed" in summary: # Check if key exists
-                    train_passed = (
-                        Text("✔", style="green", justify="center")
-                        if summary["train_passed"]
-                        else Text("✘", style="red", justify="center")
-                    )
-                else:
-                    # Default if key is missing
-                    train_passed = Text("-", style="", justify="center")
-
-                if "test_passed" in summary: # Check if key exists
-                    test_passed = (
-                        Text("✔", style="green", justify="center")
-                        if summary["test_passed"]
-                        else Text("✘", style="red", justify="center")
-                    )
-                else:
-                    # Default if key is missing
-                    test_passed = Text("-", style="", justify="center")
-                # --- END PASS/FAIL HANDLING ---
-
-                # --- START BEST SCORE HANDLING ---
-                best_score_text = (
-                    f"{summary.get('best_score'):.2f}"
-                    if summary.get("best_score") is not None
-                    else "-"
-                )
-                best_score_text = Text(best_score_text, justify="right")
-                # --- END BEST SCORE HANDLING ---
-
-                # --- START BEST TRIAL METRICS HANDLING ---
-                # Read metrics directly from the summary dictionary
-                # metrics = summary.get("best_trial_metrics", {}) # REMOVED - Read directly
-
-                def format_bool_metric(value):
-                    if value is True:
-                        return Text("✔", style="green", justify="center")
-                    elif value is False:
-                        return Text("✘", style="red", justify="center")
-                    else:
-                        return Text("-", justify="center")
-
-                # Use the correct top-level keys from the summary
-                size_correct_text = format_bool_metric(summary.get("size_correct"))
-                palette_correct_text = format_bool_metric(summary.get("color_palette_correct"))
-                color_count_correct_text = format_bool_metric(summary.get("color_count_correct"))
-
-                # Get TOTAL pixels off count directly from summary
-                pixels_off_val = summary.get("pixels_off")
-                # Format as integer string
-                pixels_off_text = Text(str(pixels_off_val) if pixels_off_val is not None else "-", justify="right")
-
-                # Get percent correct directly from summary
-                percent_correct_val = summary.get("percent_correct")
-                percent_correct_text = Text(f"{percent_correct_val:.1f}" if percent_correct_val is not None else "-", justify="right")
-                # --- END BEST TRIAL METRICS HANDLING ---
-
-
-                # Add the row with arguments in the new order (16 columns total)
-                self.table.add_row(
-                    step_dir.name,             # STEP
-                    error_text,                # ERROR
-                    test_passed,               # TEST
-                    train_passed,              # TRAIN
-                    best_score_text,           # SCORE
-                    size_correct_text,         # SIZE
-                    palette_correct_text,      # PALETTE
-                    color_count_correct_text,  # COLORS
-                    pixels_off_text,           # PIXELS
-                    percent_correct_text,      # %
-                    time_str,                  # TIME
-                    attempts_text,             # ATTEMPTS
-                    in_tokens_text,            # IN
-                    out_tokens_text,           # OUT
-                    total_tokens_text,         # TOTAL
-                    num_files                  # FILES
-                )
-
-            except FileNotFoundError:
-                # Update exception handling for 16 columns
-                self.table.add_row(step_dir.name, "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-")
-            except json.JSONDecodeError:
-                # Update exception handling for 16 columns
-                self.table.add_row(step_dir.name, "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-")
-        if self.step_dirs:
+        self._row_keys.clear()
+        self._all_rows = [self._format_row(step_dir) for step_dir in self._step_summaries]
+        self._loaded_rows = 0
+        self._extend_rows(ROW_WINDOW)
+        if self._all_rows:
             self.select_step_by_index(self.step_index)
 
     def update_summary(self):
@@ -272,7 +436,7 @@ class TaskScreen(Screen):
         # test_passed_count = 0  # No longer needed for summary display
         error_count = 0
         total_duration_seconds = 0.0
-        best_scores = []
+        best_score = None # Running minimum, no list needed
         total_prompt_tokens = 0
         total_candidates_tokens = 0
         total_tokens_all_steps = 0
@@ -283,8 +447,7 @@ class TaskScreen(Screen):
         task_train_passed = None
         task_test_passed = None
         try:
-            with open(task_summary_path, "r") as f:
-                task_summary_data = json.load(f)
+            task_summary_data = load_json(task_summary_path)
             task_train_passed = task_summary_data.get("train_passed")
             task_test_passed = task_summary_data.get("test_passed")
         except (FileNotFoundError, json.JSONDecodeError) as e:
@@ -292,46 +455,31 @@ class TaskScreen(Screen):
             # Keep task_train_passed and task_test_passed as None
 
         # --- Aggregate step details ---
-        for step_dir in self.step_dirs:
-            summary_path = step_dir / "index.json"
-            try:
-                with open(summary_path, "r") as f:
-                    step_summary = json.load(f)
-
-                # Aggregate errors, duration, score, attempts, tokens
-                if step_summary.get("has_errors"):
-                    error_count += 1
-
-                duration = step_summary.get("duration_seconds")
-                if duration is not None:
-                    total_duration_seconds += duration
-
-                score = step_summary.get("best_score")
-                if score is not None:
-                    best_scores.append(score)
-
-                attempts = step_summary.get("attempts")
-                if attempts is not None:
-                    total_attempts += attempts
-
-                prompt_tokens = step_summary.get("response", {}).get("prompt_tokens")
-                candidates_tokens = step_summary.get("response", {}).get("candidates_tokens")
-                total_tokens = step_summary.get("response", {}).get("total_tokens")
-
-                if prompt_tokens is not None:
-                    total_prompt_tokens += prompt_tokens
-                if candidates_tokens is not None:
-                    total_candidates_tokens += candidates_tokens
-                if total_tokens is not None:
-                    total_tokens_all_steps += total_tokens
-
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass # Skip steps with missing/invalid index.json
+        for step_summary in self._step_summaries.values():
+            if step_summary is None:
+                continue # Skip steps with missing/invalid index.json
+
+            # Aggregate errors, duration, score, attempts, tokens;
+            # missing values add nothing, so `or 0` keeps this branch-free
+            if step_summary.get("has_errors"):
+                error_count += 1
+            total_duration_seconds += step_summary.get("duration_seconds") or 0.0
+            total_attempts += step_summary.get("attempts") or 0
+
+            # 0.0 is a legal score, so this one still needs the None check
+            score = step_summary.get("best_score")
+            if score is not None and (best_score is None or score < best_score):
+                best_score = score
+
+            response = step_summary.get("response") or _EMPTY
+            total_prompt_tokens += response.get("prompt_tokens") or 0
+            total_candidates_tokens += response.get("candidates_tokens") or 0
+            total_tokens_all_steps += response.get("total_tokens") or 0
 
         best_score_summary = (
-            f"{min(best_scores):.2f}" if best_scores else "-"
+            f"{best_score:.2f}" if best_score is not None else "-"
         )
-        formatted_total_duration = Level._format_duration(total_duration_seconds)
+        formatted_total_duration = format_seconds(int(total_duration_seconds))
 
         # --- Determine overall pass/fail status from task summary ---
         if task_train_passed is True:
@@ -371,9 +519,63 @@ class TaskScreen(Screen):
         tokens_table.add_row(Text("total:", justify="right"), Text(f"{total_tokens_all_steps:,}", justify="right"))
 
 
+    def _extend_rows(self, count: int) -> None:
+        """Appends up to ``count`` more of the formatted rows to the table."""
+        batch = self._all_rows[self._loaded_rows:self._loaded_rows + count]
+        if batch:
+            for row, row_key in zip(batch, self.table.add_rows(batch)):
+                self._row_keys[row[0]] = row_key
+            self._loaded_rows += len(batch)
+
+    def _sync_rows(self, new_rows: list[tuple]) -> bool:
+        """Applies ``new_rows`` to the table in place, touching only what changed.
+
+        Removed steps lose their row and changed cells are updated. Steps that
+        sort after every existing one are appended to the pending rows.
+        Returns False, leaving the table alone, when a step was inserted in
+        the middle; the caller then rebuilds the table.
+        """
+        old_rows = {row[0]: row for row in self._all_rows}
+        new_names = {row[0] for row in new_rows}
+        kept = [name for name in old_rows if name in new_names]
+        added = [row[0] for row in new_rows if row[0] not in old_rows]
+        if [row[0] for row in new_rows] != kept + added:
+            return False
+
+        all_loaded = self._loaded_rows == len(self._all_rows)
+        with self.app.batch_update():
+            for name in old_rows.keys() - new_names:
+                row_key = self._row_keys.pop(name, None)
+                if row_key is not None:
+                    self.table.remove_row(row_key)
+            for row in new_rows:
+                row_key = self._row_keys.get(row[0])
+                if row_key is None or row is old_rows[row[0]]:
+                    continue # Not inserted yet, new, or reused unchanged from the row cache
+                for col_key, old_cell, new_cell in zip(self._col_keys, old_rows[row[0]], row):
+                    if old_cell != new_cell:
+                        self.table.update_cell(row_key, col_key, new_cell, update_width=True)
+            # Loaded rows are still a prefix of the step order, so the window stays valid
+            self._all_rows = new_rows
+            self._loaded_rows = len(self._row_keys)
+            self._extend_rows(len(new_rows) if all_loaded else ROW_WINDOW - self._loaded_rows)
+        return True
+
+    def _ensure_row_loaded(self, index: int) -> None:
+        """Makes sure the row at ``index`` plus a prefetch margin is in the table."""
+        count = rows_to_load(index, self._loaded_rows)
+        if count:
+            self._extend_rows(count)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        # Covers mouse, page and home/end movement as well as j/k
+        if event.data_table is self.table:
+            self._ensure_row_loaded(event.cursor_row)
+
     def select_step_by_index(self, index: int) -> None:
         if self.step_dirs:
             self.step_index = index
+            self._ensure_row_loaded(index)
             self.table.move_cursor(row=index)
 
     def previous_sibling(self):
@@ -391,6 +593,7 @@ class TaskScreen(Screen):
 
     def action_move_down(self):
         row = self.table.cursor_row + 1
+        self._ensure_row_loaded(row)
         self.table.move_cursor(row=row)
         self.step_index = self.table.cursor_row  # Update index
 
@@ -447,13 +650,25 @@ class TaskScreen(Screen):
         current_cursor_row = self.table.cursor_row
 
         # Re-read step directories in case they changed
-        self.step_dirs = sorted([d for d in self.task_path.iterdir() if d.is_dir()])
-
-        self.load_steps() # Reloads table data
+        self.step_dirs = list_step_dirs(self.task_path)
+
+        # Nothing on disk changed since the last load: skip re-reading and re-rendering
+        fingerprint = _task_fingerprint(self.task_path, self.step_dirs)
+        if fingerprint == self._fingerprint:
+            log.info(f"TaskScreen {self.task_path.name} unchanged; skipping reload")
+            self.table.focus()
+            return
+        self._fingerprint = fingerprint
+
+        self._load_summaries() # Re-reads only summaries whose index.json changed
+        new_rows = [self._format_row(step_dir) for step_dir in self.step_dirs]
+        if not self._sync_rows(new_rows):
+            self.load_steps() # Step inserted mid-list; rebuild table data
         self.update_summary() # Reloads summary data
 
         # Restore cursor position if possible
-        if current_cursor_row is not None and 0 <= current_cursor_row < self.table.row_count:
+        if current_cursor_row is not None and 0 <= current_cursor_row < len(self._all_rows):
+            self._ensure_row_loaded(current_cursor_row)
             self.table.move_cursor(row=current_cursor_row, animate=False)
         elif self.table.row_count > 0:
             self.table.move_cursor(row=0, animate=False) # Move to top if previous row is gone
@@ -477,54 +692,22 @@ class TaskScreen(Screen):
         self.current_sort_key = sort_key
         self.current_sort_reverse = reverse
 
-        # Define key function: receives cell_data directly when sorting by one key
-        def get_sort_key(cell_data):
-            # No need to find index or extract cell_data, it's passed directly.
-            key_str = str(sort_key) # Use string representation of the *column* key
-
-            if key_str == "STEP":
-                # Extract number from step name like "001_..."
-                name = str(cell_data)
-                match = re.match(r"(\d+)", name)
-                return int(match.group(1)) if match else -1
-
-            if key_str in ["ERROR", "TEST", "TRAIN", "SIZE", "PALETTE", "COLORS"]:
-                # Handle ✔ / ✘ / - / ⚠
-                plain_text = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                if plain_text == "✔": return 1
-                if plain_text == "✘": return -1
-                if plain_text == "⚠": return -2 # Sort errors before fails
-                return 0 # Sort '-' in the middle
-
-            if key_str in ["SCORE", "PIXELS", "%", "ATTEMPTS", "IN", "OUT", "TOTAL", "FILES"]:
-                # Handle numbers (potentially in Text objects)
-                plain_text = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                plain_text = plain_text.replace(',', '') # Remove commas
-                if plain_text == "-": return float('-inf') # Sort '-' first
-                try:
-                    return float(plain_text)
-                except ValueError:
-                    log.warning(f"Could not convert '{plain_text}' to float for sorting key '{key_str}'")
-                    return float('-inf') # Sort errors consistently first
-
-            if key_str == "TIME":
-                # Parse HH:MM:SS string into seconds
-                time_str = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                if time_str == "-": return -1
-                try:
-                    parts = list(map(int, time_str.split(':')))
-                    if len(parts) == 3: return parts[0] * 3600 + parts[1] * 60 + parts[2]
-                    else: return float('-inf')
-                except ValueError:
-                    log.warning(f"Could not parse time string '{time_str}' for sorting")
-                    return float('-inf')
-
-            # Fallback: Ensure a string is always returned for comparison
-            return str(cell_data.plain) if hasattr(cell_data, 'plain') else str(cell_data)
+        get_sort_key = self._sort_parsers.get(sort_key, parse_string)
 
-        # Perform the sort
+        # Perform the sort over every step, not just the inserted window:
+        # decorate each row with its key once, sort, then reload the window
         try:
-            self.table.sort(sort_key, key=get_sort_key, reverse=reverse)
+            col_index = self._col_index[sort_key]
+            decorated = [(get_sort_key(row[col_index]), row) for row in self._all_rows]
+            decorated.sort(key=lambda pair: pair[0], reverse=reverse)
+            cursor_row = self.table.cursor_row
+            with self.app.batch_update():
+                self.table.clear()
+                self._row_keys.clear()
+                self._all_rows = [row for _, row in decorated]
+                self._loaded_rows = 0
+                self._extend_rows(rows_to_load(cursor_row, 0))
+                self.table.move_cursor(row=cursor_row, animate=False)
             self.notify(f"Sorted by {str(self.table.columns[sort_key].label)} {'(desc)' if reverse else '(asc)'}")
         except Exception as e:
             log.error(f"Error during DataTable sort: {e}")
@@ -540,7 +723,7 @@ class TaskScreen(Screen):
                 try:
                     step_trials = [
                         f for f in step_dir.iterdir()
-                        if f.is_file() and (f.name.endswith(".trial.json") or f.name.endswith("trials.json"))
+                        if f.name.endswith(TRIAL_SUFFIXES) and f.is_file()
                     ]
                     if step_trials:
                         log.debug(f"Found {len(step_trials)} trials in step {step_dir.name}")
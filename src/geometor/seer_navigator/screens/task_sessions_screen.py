@@ -24,8 +24,114 @@ import json
 
 # Import Task to calculate weight
 from geometor.seer.tasks.tasks import Task
-from geometor.seer_navigator.screens.task_screen import TaskScreen
-from geometor.seer.session.level import Level  # Import Level
+from geometor.seer_navigator.screens.task_screen import TaskScreen, list_step_dirs
+from geometor.seer_navigator.screens.sort_parsers import (
+    parse_string,
+    parse_glyph,
+    parse_number,
+    parse_time,
+    resolve_sort_parsers,
+)
+from geometor.seer_navigator.screens.common import (
+    BOOL_MAP,
+    DASH_CENTER,
+    ROW_WINDOW,
+    WARN,
+    format_seconds,
+    load_json,
+    mtime_ns,
+    read_concurrently,
+    rows_to_load,
+    text_right,
+)
+
+
+def _load_summary(task_dir: Path) -> dict:
+    """Loads a task instance's index.json."""
+    return load_json(task_dir / "index.json")
+
+
+# Task weight per task_id for this process; reopening a task skips
+# re-reading task.json and rebuilding the Task. Nothing is written to disk.
+_TASK_WEIGHTS: dict[str, int] = {}
+
+
+# Shared read-only default for summaries without a "tokens" section
+_EMPTY: dict = {}
+
+
+_BLANK = Text("") # Empty third cell in the summary tables
+
+
+def _pct(num: int, den: int) -> str:
+    """Formats num/den as a percentage, '-' when there is nothing to divide by."""
+    return f"{100 * num / den:.1f}%" if den else "-"
+
+
+def _build_row(session_name: str, summary: dict) -> tuple:
+    """Builds an instance's table cells, all but the shared WEIGHT cell."""
+    # Pull every field the row needs once; the cells below use locals only
+    steps = summary.get("steps", 0)
+    duration = summary.get("duration_seconds")
+    has_errors = summary.get("has_errors", False) # Default to False if missing
+    train_value = summary.get("train_passed")
+    test_value = summary.get("test_passed")
+    best_score = summary.get("best_score")
+    tokens_data = summary.get("tokens") or _EMPTY
+    prompt_tokens = tokens_data.get("prompt_tokens")
+    candidates_tokens = tokens_data.get("candidates_tokens")
+    total_tokens = tokens_data.get("total_tokens")
+
+    num_steps = text_right(str(steps))
+    time_str = format_seconds(int(duration)) if duration is not None else "-"
+    # Check the 'has_errors' boolean field directly
+    error_text = WARN if has_errors else DASH_CENTER # Use warning symbol
+    in_tokens_text = text_right("-" if prompt_tokens is None else str(prompt_tokens))
+    out_tokens_text = text_right("-" if candidates_tokens is None else str(candidates_tokens))
+    total_tokens_text = text_right("-" if total_tokens is None else str(total_tokens))
+
+    train_passed = BOOL_MAP.get(train_value, DASH_CENTER)
+    test_passed = BOOL_MAP.get(test_value, DASH_CENTER)
+
+    best_score_text = text_right(f"{best_score:.2f}" if best_score is not None else "-")
+
+    # Session name as the first column
+    return (
+        session_name,        # SESSION
+        error_text,          # ERROR
+        test_passed,         # TEST
+        train_passed,        # TRAIN
+        best_score_text,     # SCORE
+        num_steps,           # STEPS
+        time_str,            # TIME
+        in_tokens_text,      # IN
+        out_tokens_text,     # OUT
+        total_tokens_text,   # TOTAL
+    )
+
+
+def _instances_fingerprint(sessions_root: Path, task_id: str) -> tuple:
+    """Stat-only fingerprint of a task's instances: (session, index.json mtime)
+    for every session, None where the task or its index.json is missing."""
+    with os.scandir(sessions_root) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_dir())
+    return tuple((name, mtime_ns(sessions_root / name / task_id / "index.json")) for name in names)
+
+
+# Sort key parser for each main table column, keyed by column label
+SORT_PARSERS = {
+    "SESSION": parse_string,
+    "ERROR": parse_glyph,
+    "TEST": parse_glyph,
+    "TRAIN": parse_glyph,
+    "SCORE": parse_number,
+    "STEPS": parse_number,
+    "WEIGHT": parse_number,
+    "IN": parse_number,
+    "OUT": parse_number,
+    "TOTAL": parse_number,
+    "TIME": parse_time,
+}
 
 
 class TaskSessionsScreen(Screen):
@@ -74,11 +180,17 @@ class TaskSessionsScreen(Screen):
         self.instance_index = 0
         self.current_sort_key: ColumnKey | None = None
         self.current_sort_reverse: bool = False
+        # Parsed index.json per task instance, filled by load_task_instances
+        self._summary_cache: dict[Path, dict] = {}
+        self._task_weight_value = 0 # Task weight from task.json, 0 if unknown
+        self._row_payloads: list[tuple] = [] # Table cells per instance, parallel to task_instances
+        self._loaded_rows = 0 # Only the first _loaded_rows payloads are in the table
+        self._fingerprint: tuple | None = None # _instances_fingerprint of the last load
 
     def compose(self) -> ComposeResult:
         self.table = DataTable() # Main table showing task instances per session
         # Columns are the same as SessionScreen's task table, but first column is SESSION
-        self.table.add_columns(
+        self._col_keys: list[ColumnKey] = self.table.add_columns(
             "SESSION", # Changed from TASKS
             Text("ERROR", justify="center"),
             "TEST",
@@ -91,6 +203,9 @@ class TaskSessionsScreen(Screen):
             Text("TOTAL", justify="right"),
             Text("WEIGHT", justify="right"),
         )
+        # Column order is fixed from here on; resolve each column's position and sort parser once
+        self._col_index = {key: index for index, key in enumerate(self._col_keys)}
+        self._sort_parsers = resolve_sort_parsers(self.table, SORT_PARSERS)
         self.table.cursor_type = "row"
 
         yield Header()
@@ -118,133 +233,96 @@ class TaskSessionsScreen(Screen):
         tokens_table.add_columns("Metric", "Value")
 
         self.table.focus()
-        self.load_task_instances() # Load main table data
+        self.load_task_instances() # Load main table data (sets the sort state)
         self.update_summary() # Populate summary tables
-        self.current_sort_key = None
-        self.current_sort_reverse = False
 
     def load_task_instances(self):
         """Loads data for the specific task_id across all sessions."""
         self.table.clear()
         self.task_instances = [] # Clear previous instances
+        self._summary_cache.clear()
+        self._task_weight_value = 0
+        self._row_payloads = []
+        self._loaded_rows = 0
+
+        rows: list[tuple] = [] # Cells before WEIGHT, added once the weight is known
+        cached_weight = _TASK_WEIGHTS.get(self.task_id)
+        task_json_path_found = None # First task.json seen, used for the weight
+        # Task instances in session order; their index.json files are read concurrently
+        candidates: list[tuple[str, Path]] = []
+        fingerprint: list[tuple[str, int | None]] = [] # Same shape as _instances_fingerprint
+        # DirEntry.is_dir answers from the readdir entry type, no stat per session
+        with os.scandir(self.sessions_root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    task_dir = Path(entry.path) / self.task_id
+                    fingerprint.append((entry.name, mtime_ns(task_dir / "index.json")))
+                    if task_dir.is_dir():
+                        if cached_weight is None and task_json_path_found is None and (task_dir / "task.json").exists():
+                            task_json_path_found = task_dir / "task.json"
+                        candidates.append((entry.name, task_dir)) # Session name for the first column
+        # Deterministic baseline order: by session name, ascending
+        candidates.sort(key=lambda candidate: candidate[0])
+        self._fingerprint = tuple(sorted(fingerprint))
+        self.current_sort_key = self._col_keys[0] # SESSION
+        self.current_sort_reverse = False
 
-        task_weight = "-" # Calculate weight once (assuming it's the same task)
-        task_json_path_found = None
-        for session_dir in self.sessions_root.iterdir():
-             if session_dir.is_dir():
-                 task_instance_path = session_dir / self.task_id / "task.json"
-                 if task_instance_path.exists():
-                     task_json_path_found = task_instance_path
-                     break # Found one, use it for weight calculation
-
-        if task_json_path_found:
+        summaries = read_concurrently(_load_summary, [task_dir for _, task_dir in candidates])
+        for (session_name, task_dir), summary_future in zip(candidates, summaries):
             try:
-                with open(task_json_path_found, "r") as f_task:
-                    task_data = json.load(f_task)
-                task_obj = Task(self.task_id, task_data)
-                task_weight = Text(str(task_obj.weight), justify="right")
-            except (json.JSONDecodeError, Exception) as e_task:
-                log.error(f"Error loading or processing {task_json_path_found} for weight: {e_task}")
-                task_weight = Text("ERR", justify="right", style="bold red")
-        else:
-             log.warning(f"Could not find task.json for task {self.task_id} in any session to determine weight.")
-             task_weight = Text("?", justify="right", style="dim")
-
-
-        for session_dir in self.sessions_root.iterdir():
-            if session_dir.is_dir():
-                task_dir = session_dir / self.task_id
-                if task_dir.is_dir():
-                    summary_path = task_dir / "index.json"
-                    session_name = session_dir.name # Get the session name
-
-                    try:
-                        # Load task summary from this specific session
-                        with open(summary_path, "r") as f:
-                            summary = json.load(f)
-
-                        self.task_instances.append(task_dir) # Store the path to this task instance
-
-                        num_steps = Text(str(summary.get("steps", 0)), justify="right")
-                        time_str = (
-                            Level._format_duration(summary.get("duration_seconds"))
-                            if summary.get("duration_seconds") is not None
-                            else "-"
-                        )
-                        # Check the 'has_errors' boolean field directly
-                        has_errors = summary.get("has_errors", False) # Default to False if missing
-                        error_text = (
-                            Text("⚠", style="bold #FFD700", justify="center") # Use warning symbol
-                            if has_errors
-                            else Text("-", justify="center")
-                        )
-                        tokens_data = summary.get("tokens", {})
-                        prompt_tokens = tokens_data.get("prompt_tokens")
-                        candidates_tokens = tokens_data.get("candidates_tokens")
-                        total_tokens = tokens_data.get("total_tokens")
-                        in_tokens_text = Text(str(prompt_tokens) if prompt_tokens is not None else "-", justify="right")
-                        out_tokens_text = Text(str(candidates_tokens) if candidates_tokens is not None else "-", justify="right")
-                        total_tokens_text = Text(str(total_tokens) if total_tokens is not None else "-", justify="right")
-
-                        if "train_passed" in summary and summary["train_passed"] is not None:
-                            train_passed = (
-                                Text("✔", style="green", justify="center")
-                                if summary["train_passed"]
-                                else Text("✘", style="red", justify="center")
-                            )
-                        else:
-                            train_passed = Text("-", style="", justify="center")
-
-                        if "test_passed" in summary and summary["test_passed"] is not None:
-                            test_passed = (
-                                Text("✔", style="green", justify="center")
-                                if summary["test_passed"]
-                                else Text("✘", style="red", justify="center")
-                            )
-                        else:
-                            test_passed = Text("-", style="", justify="center")
-
-                        best_score_text = (
-                            f"{summary.get('best_score'):.2f}"
-                            if summary.get("best_score") is not None
-                            else "-"
-                        )
-                        best_score_text = Text(best_score_text, justify="right")
-
-                        # Add the row, using session_name as the first column
-                        self.table.add_row(
-                            session_name,        # SESSION
-                            error_text,          # ERROR
-                            test_passed,         # TEST
-                            train_passed,        # TRAIN
-                            best_score_text,     # SCORE
-                            num_steps,           # STEPS
-                            time_str,            # TIME
-                            in_tokens_text,      # IN
-                            out_tokens_text,     # OUT
-                            total_tokens_text,   # TOTAL
-                            task_weight          # WEIGHT (same for all rows)
-                        )
-
-                    except FileNotFoundError:
-                        log.warning(f"Missing index.json for task {self.task_id} in session {session_name}")
-                        # Optionally add a row indicating missing data
-                        # self.table.add_row(session_name, "-", "-", "-", "-", "-", "-", "-", "-", "-", "-")
-                    except json.JSONDecodeError:
-                        log.error(f"Invalid JSON in index.json for task {self.task_id} in session {session_name}")
-                        # Optionally add a row indicating error
-                        # self.table.add_row(session_name, Text("ERR", style="bold red"), "-", "-", "-", "-", "-", "-", "-", "-", "-")
-                    except Exception as e:
-                        log.error(f"Error processing task instance {task_dir.name} in session {session_name}: {e}")
-                        # Optionally add a row indicating error
-                        # self.table.add_row(session_name, Text("ERR", style="bold red"), "-", "-", "-", "-", "-", "-", "-", "-", "-")
-
+                # Load task summary from this specific session
+                summary = summary_future.result()
+
+                rows.append(_build_row(session_name, summary))
+                # Only once its row is built, so instances and rows stay aligned
+                self.task_instances.append(task_dir) # Store the path to this task instance
+                self._summary_cache[task_dir] = summary
+
+            except FileNotFoundError:
+                log.warning(f"Missing index.json for task {self.task_id} in session {session_name}")
+                # Optionally add a row indicating missing data
+                # self.table.add_row(session_name, "-", "-", "-", "-", "-", "-", "-", "-", "-", "-")
+            except json.JSONDecodeError:
+                log.error(f"Invalid JSON in index.json for task {self.task_id} in session {session_name}")
+                # Optionally add a row indicating error
+                # self.table.add_row(session_name, Text("ERR", style="bold red"), "-", "-", "-", "-", "-", "-", "-", "-", "-")
+            except Exception as e:
+                log.error(f"Error processing task instance {task_dir.name} in session {session_name}: {e}")
+                # Optionally add a row indicating error
+                # self.table.add_row(session_name, Text("ERR", style="bold red"), "-", "-", "-", "-", "-", "-", "-", "-", "-")
+
+
+        task_weight = self._load_weight(cached_weight, task_json_path_found)
+        self._row_payloads = [(*row, task_weight) for row in rows] # WEIGHT (same for all rows)
+        self._extend_rows(ROW_WINDOW)
 
         if self.task_instances:
             self.select_instance_by_index(self.instance_index)
         else:
             self.table.add_row(f"Task '{self.task_id}' not found in any session.")
 
+    def _load_weight(self, cached_weight, task_json_path: Path | None) -> Text:
+        """Returns the WEIGHT cell and sets _task_weight_value.
+
+        A weight already computed in this process skips reading task.json and
+        building the Task; otherwise the weight is computed and remembered.
+        """
+        if cached_weight is not None:
+            self._task_weight_value = cached_weight # Reused by update_summary
+            return Text(str(cached_weight), justify="right")
+        if task_json_path is None:
+            log.warning(f"Could not find task.json for task {self.task_id} in any session to determine weight.")
+            return Text("?", justify="right", style="dim")
+        try:
+            task_data = load_json(task_json_path)
+            task_obj = Task(self.task_id, task_data)
+        except (json.JSONDecodeError, Exception) as e_task:
+            log.error(f"Error loading or processing {task_json_path} for weight: {e_task}")
+            return Text("ERR", justify="right", style="bold red")
+        self._task_weight_value = task_obj.weight # Reused by update_summary
+        _TASK_WEIGHTS[self.task_id] = task_obj.weight
+        return Text(str(task_obj.weight), justify="right")
+
     def update_summary(self):
         """Updates the summary tables for the specific task across displayed sessions."""
         summary_table = self.query_one("#summary-table", DataTable)
@@ -257,151 +335,111 @@ class TaskSessionsScreen(Screen):
         test_passed_count = 0
         error_count = 0
         total_duration_seconds = 0.0
-        best_scores = []
+        best_score = None # Running minimum, no list needed
         total_prompt_tokens = 0
         total_candidates_tokens = 0
         total_tokens_all_instances = 0
         total_weight = 0 # Will be weight * num_instances if weight is valid
 
-        task_weight_value = 0
-        # Recalculate weight value for summary (could optimize by storing from load)
-        task_json_path_found = None
-        for session_dir in self.sessions_root.iterdir():
-             if session_dir.is_dir():
-                 task_instance_path = session_dir / self.task_id / "task.json"
-                 if task_instance_path.exists():
-                     task_json_path_found = task_instance_path
-                     break
-        if task_json_path_found:
-            try:
-                with open(task_json_path_found, "r") as f_task:
-                    task_data = json.load(f_task)
-                task_obj = Task(self.task_id, task_data)
-                task_weight_value = task_obj.weight
-            except: pass # Error already logged
-
-        for task_instance_path in self.task_instances:
-            summary_path = task_instance_path / "index.json"
-            try:
-                with open(summary_path, "r") as f:
-                    task_summary = json.load(f)
-
-                total_steps_count += task_summary.get("steps", 0)
-                if task_summary.get("train_passed"):
-                    train_passed_count += 1
-                if task_summary.get("test_passed"):
-                    test_passed_count += 1
-                # Check the 'has_errors' boolean field directly for summary count
-                if task_summary.get("has_errors", False):
-                    error_count += 1
-
-                duration = task_summary.get("duration_seconds")
-                if duration is not None:
-                    total_duration_seconds += duration
-
-                score = task_summary.get("best_score")
-                if score is not None:
-                    best_scores.append(score)
-
-                tokens_data = task_summary.get("tokens", {})
-                prompt_tokens = tokens_data.get("prompt_tokens")
-                candidates_tokens = tokens_data.get("candidates_tokens")
-                total_tokens = tokens_data.get("total_tokens")
-
-                if prompt_tokens is not None:
-                    total_prompt_tokens += prompt_tokens
-                if candidates_tokens is not None:
-                    total_candidates_tokens += candidates_tokens
-                if total_tokens is not None:
-                    total_tokens_all_instances += total_tokens
-
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass # Skip tasks with missing/invalid index.json
+        task_weight_value = self._task_weight_value # Read once by load_task_instances
+
+        for task_summary in self._summary_cache.values():
+            total_steps_count += task_summary.get("steps", 0)
+            if task_summary.get("train_passed"):
+                train_passed_count += 1
+            if task_summary.get("test_passed"):
+                test_passed_count += 1
+            # Check the 'has_errors' boolean field directly for summary count
+            if task_summary.get("has_errors", False):
+                error_count += 1
+
+            # Missing values add nothing, so `or 0` keeps these branch-free
+            total_duration_seconds += task_summary.get("duration_seconds") or 0.0
+
+            # 0.0 is a legal score, so this one still needs the None check
+            score = task_summary.get("best_score")
+            if score is not None and (best_score is None or score < best_score):
+                best_score = score
+
+            tokens_data = task_summary.get("tokens") or _EMPTY
+            total_prompt_tokens += tokens_data.get("prompt_tokens") or 0
+            total_candidates_tokens += tokens_data.get("candidates_tokens") or 0
+            total_tokens_all_instances += tokens_data.get("total_tokens") or 0
 
         if task_weight_value > 0:
             total_weight = task_weight_value * num_instances
 
         best_score_summary = (
-            f"{min(best_scores):.2f}" if best_scores else "-"
+            f"{best_score:.2f}" if best_score is not None else "-"
         )
-        formatted_total_duration = Level._format_duration(total_duration_seconds)
-        test_percent = (test_passed_count / num_instances * 100) if num_instances > 0 else 0.0
-        test_percent_str = f"{test_percent:.1f}%"
+        formatted_total_duration = format_seconds(int(total_duration_seconds))
+        test_percent_str = _pct(test_passed_count, num_instances)
         diff = test_passed_count - train_passed_count
         diff_str = f"{diff:+}"
         avg_steps_per_instance = (total_steps_count / num_instances) if num_instances > 0 else 0.0
         avg_steps_str = f"{avg_steps_per_instance:.1f} avg"
 
-        # Clear and update summary table
+        # Clear and update summary table (one add_rows call per table)
         summary_table.clear()
-        summary_table.add_row(
-            Text("steps:", justify="right"),
-            Text(str(total_steps_count), justify="right"),
-            Text(avg_steps_str, justify="right")
-        )
-        summary_table.add_row(
-            Text("time:", justify="right"),
-            Text(formatted_total_duration, justify="right"),
-            Text("")
-        )
-        summary_table.add_row(
-            Text("best:", justify="right"),
-            Text(best_score_summary, justify="right"),
-            Text("")
-        )
-        summary_table.add_row(
-            Text("weight:", justify="right"),
-            Text(f"{total_weight:,}" if total_weight > 0 else "-", justify="right"),
-            Text("")
-        )
+        summary_table.add_rows([
+            (text_right("steps:"), text_right(str(total_steps_count)), text_right(avg_steps_str)),
+            (text_right("time:"), text_right(formatted_total_duration), _BLANK),
+            (text_right("best:"), text_right(best_score_summary), _BLANK),
+            (text_right("weight:"), text_right(f"{total_weight:,}" if total_weight > 0 else "-"), _BLANK),
+        ])
 
         # Clear and update trials table
         trials_table.clear()
-        trials_table.add_row(
-            Text("sessions:", justify="right"),
-            Text(str(num_instances), justify="right"),
-            Text("")
-        )
-        trials_table.add_row(
-            Text("test:", justify="right"),
-            Text(str(test_passed_count), justify="right"),
-            Text(test_percent_str, justify="right")
-        )
-        trials_table.add_row(
-            Text("train:", justify="right"),
-            Text(str(train_passed_count), justify="right"),
-            Text(diff_str, justify="right")
-        )
-        trials_table.add_row(
-            Text("errors:", justify="right"),
-            Text(str(error_count), justify="right"),
-            Text("")
-        )
+        trials_table.add_rows([
+            (text_right("sessions:"), text_right(str(num_instances)), _BLANK),
+            (text_right("test:"), text_right(str(test_passed_count)), text_right(test_percent_str)),
+            (text_right("train:"), text_right(str(train_passed_count)), text_right(diff_str)),
+            (text_right("errors:"), text_right(str(error_count)), _BLANK),
+        ])
 
         # Clear and update tokens table
         tokens_table.clear()
-        tokens_table.add_row(Text("in:", justify="right"), Text(f"{total_prompt_tokens:,}", justify="right"))
-        tokens_table.add_row(Text("out:", justify="right"), Text(f"{total_candidates_tokens:,}", justify="right"))
-        tokens_table.add_row(Text("total:", justify="right"), Text(f"{total_tokens_all_instances:,}", justify="right"))
+        tokens_table.add_rows([
+            (text_right("in:"), text_right(f"{total_prompt_tokens:,}")),
+            (text_right("out:"), text_right(f"{total_candidates_tokens:,}")),
+            (text_right("total:"), text_right(f"{total_tokens_all_instances:,}")),
+        ])
+
+    def _extend_rows(self, count: int) -> None:
+        """Appends up to ``count`` more of the cached instance rows to the table."""
+        end = min(self._loaded_rows + count, len(self._row_payloads))
+        for index in range(self._loaded_rows, end):
+            # Row key is the instance path
+            self.table.add_row(*self._row_payloads[index], key=str(self.task_instances[index]))
+        self._loaded_rows = max(self._loaded_rows, end)
+
+    def _ensure_row_loaded(self, index: int) -> None:
+        """Makes sure the row at ``index`` plus a prefetch margin is in the table."""
+        count = rows_to_load(index, self._loaded_rows)
+        if count:
+            self._extend_rows(count)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        # Covers mouse, page and home/end movement as well as j/k
+        if event.data_table is self.table:
+            self._ensure_row_loaded(event.cursor_row)
 
     def select_instance_by_index(self, index: int) -> None:
         if 0 <= index < len(self.task_instances):
             self.instance_index = index
+            self._ensure_row_loaded(index)
             self.table.move_cursor(row=index)
 
     def action_move_up(self):
         if not self.task_instances: return
-        row = self.table.cursor_row - 1
-        if row >= 0:
-            self.table.move_cursor(row=row)
-            self.instance_index = self.table.cursor_row
+        self.table.action_cursor_up() # Bounds handled by DataTable
+        self.instance_index = self.table.cursor_row
 
     def action_move_down(self):
         if not self.task_instances: return
-        row = self.table.cursor_row + 1
-        if row < len(self.task_instances):
-            self.table.move_cursor(row=row)
-            self.instance_index = self.table.cursor_row
+        self._ensure_row_loaded(self.table.cursor_row + 1)
+        self.table.action_cursor_down() # Bounds handled by DataTable
+        self.instance_index = self.table.cursor_row
 
     def action_select_row(self):
         if not self.task_instances: return
@@ -415,7 +453,7 @@ class TaskSessionsScreen(Screen):
 
         # Get step directories for the selected task instance
         try:
-            step_dirs = sorted([d for d in task_path.iterdir() if d.is_dir()])
+            step_dirs = list_step_dirs(task_path)
         except FileNotFoundError:
             log.error(f"Task directory not found when selecting row: {task_path}")
             self.notify(f"Error: Task directory not found.", severity="error")
@@ -437,15 +475,66 @@ class TaskSessionsScreen(Screen):
         self.app.action_view_images()
     # --- END ADDED IMAGE VIEW ACTION ---
 
+    def _patch_instances(self, fingerprint: tuple) -> bool:
+        """Re-reads only the instances whose index.json changed and updates
+        their cached rows and table cells in place.
+
+        Returns False, changing nothing, when sessions or instances were
+        added or removed, or a changed file cannot be read; the caller then
+        reloads everything.
+        """
+        old = dict(self._fingerprint or ())
+        new = dict(fingerprint)
+        if old.keys() != new.keys():
+            return False
+        changed = [name for name, mtime in new.items() if mtime != old[name]]
+        index_by_session = {task_dir.parent.name: i for i, task_dir in enumerate(self.task_instances)}
+        if any(name not in index_by_session or new[name] is None for name in changed):
+            return False
+
+        updates = []
+        for name in changed:
+            index = index_by_session[name]
+            task_dir = self.task_instances[index]
+            try:
+                summary = _load_summary(task_dir)
+                row = _build_row(name, summary)
+            except Exception as e:
+                log.warning(f"Could not re-read {task_dir / 'index.json'}, reloading all instances: {e}")
+                return False
+            updates.append((index, task_dir, summary, row))
+
+        with self.app.batch_update():
+            for index, task_dir, summary, row in updates:
+                old_payload = self._row_payloads[index]
+                payload = (*row, old_payload[-1]) # WEIGHT is unchanged
+                self._row_payloads[index] = payload
+                self._summary_cache[task_dir] = summary
+                if index < self._loaded_rows:
+                    for col_key, old_cell, new_cell in zip(self._col_keys, old_payload, payload):
+                        if old_cell != new_cell:
+                            self.table.update_cell(str(task_dir), col_key, new_cell, update_width=True)
+        self._fingerprint = fingerprint
+        return True
+
     def refresh_content(self) -> None:
         """Reloads task instance data and updates the screen."""
         log.info(f"Refreshing TaskSessionsScreen content for task {self.task_id}...")
         current_cursor_row = self.table.cursor_row
 
-        self.load_task_instances()
+        # Nothing on disk changed since the last load: skip re-reading and re-rendering
+        fingerprint = _instances_fingerprint(self.sessions_root, self.task_id)
+        if fingerprint == self._fingerprint:
+            log.info(f"TaskSessionsScreen {self.task_id} unchanged; skipping reload")
+            self.table.focus()
+            return
+
+        if not self._patch_instances(fingerprint):
+            self.load_task_instances()
         self.update_summary()
 
-        if current_cursor_row is not None and 0 <= current_cursor_row < self.table.row_count:
+        if current_cursor_row is not None and 0 <= current_cursor_row < len(self.task_instances):
+            self._ensure_row_loaded(current_cursor_row)
             self.table.move_cursor(row=current_cursor_row, animate=False)
         elif self.table.row_count > 0:
             self.table.move_cursor(row=0, animate=False)
@@ -467,90 +556,29 @@ class TaskSessionsScreen(Screen):
         self.current_sort_key = sort_key
         self.current_sort_reverse = reverse
 
-        def get_sort_key(row_data):
-            try:
-                col_index = list(self.table.columns.keys()).index(sort_key)
-                cell_data = row_data[col_index]
-            except (ValueError, IndexError):
-                log.error(f"Could not find index for sort key '{sort_key}'")
-                return float('-inf') # Return comparable value instead of None
-
-            key_str = str(sort_key)
-
-            if key_str == "SESSION":
-                return cell_data # Simple string sort
-
-            if key_str in ["ERROR", "TEST", "TRAIN"]:
-                plain_text = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                if plain_text == "✔": return 1
-                if plain_text == "✘": return -1
-                if plain_text == "⚠": return -2
-                return 0
-
-            if key_str in ["SCORE", "STEPS", "WEIGHT", "IN", "OUT", "TOTAL"]:
-                plain_text = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                plain_text = plain_text.replace(',', '')
-                if key_str == "WEIGHT" and plain_text in ["ERR", "?"]: return float('-inf')
-                if plain_text == "-": return float('-inf')
-                try:
-                    return float(plain_text)
-                except ValueError:
-                    return float('-inf')
-
-            if key_str == "TIME":
-                time_str = cell_data.plain if hasattr(cell_data, 'plain') else str(cell_data)
-                if time_str == "-": return -1
-                try:
-                    parts = list(map(int, time_str.split(':')))
-                    if len(parts) == 3: return parts[0] * 3600 + parts[1] * 60 + parts[2]
-                    else: return float('-inf')
-                except ValueError:
-                    return float('-inf')
-
-            # Fallback: Ensure a string is always returned for comparison
-            return str(cell_data.plain) if hasattr(cell_data, 'plain') else str(cell_data)
+        get_sort_key = self._sort_parsers.get(sort_key, parse_string)
+
+        if not self.task_instances:
+            return # Only the "not found" placeholder row
 
         try:
-            # Sort the underlying data list first
-            self.task_instances.sort(key=lambda task_path: get_sort_key(self._get_row_data_for_path(task_path)), reverse=reverse)
-            # Reload the table from the sorted list
-            self.load_task_instances() # This clears and repopulates based on self.task_instances order
+            # Sort every instance with its cached row, not just the inserted
+            # window, then reload the window; no files are re-read
+            col_index = self._col_index[sort_key]
+            pairs = sorted(
+                zip(self.task_instances, self._row_payloads),
+                key=lambda pair: get_sort_key(pair[1][col_index]),
+                reverse=reverse,
+            )
+            cursor_row = self.table.cursor_row
+            with self.app.batch_update():
+                self.table.clear()
+                self.task_instances = [task_path for task_path, _ in pairs]
+                self._row_payloads = [payload for _, payload in pairs]
+                self._loaded_rows = 0
+                self._extend_rows(rows_to_load(cursor_row, 0))
+                self.table.move_cursor(row=cursor_row, animate=False)
             self.notify(f"Sorted by {str(self.table.columns[sort_key].label)} {'(desc)' if reverse else '(asc)'}")
         except Exception as e:
             log.error(f"Error during DataTable sort: {e}")
             self.notify(f"Error sorting table: {e}", severity="error")
-
-    def _get_row_data_for_path(self, task_path: Path) -> tuple:
-        """Helper to get row data tuple for sorting comparison, mirroring table columns."""
-        # This is inefficient as it re-reads the file, but needed for sorting the path list
-        summary_path = task_path / "index.json"
-        session_name = task_path.parent.name
-        task_weight = "-" # Simplified for sorting helper - actual weight is complex
-
-        try:
-            with open(summary_path, "r") as f:
-                summary = json.load(f)
-
-            num_steps = Text(str(summary.get("steps", 0)))
-            time_str = Text(Level._format_duration(summary.get("duration_seconds")) if summary.get("duration_seconds") is not None else "-")
-            has_errors = summary.get("errors", {}).get("count", 0) > 0
-            error_text = Text("⚠") if has_errors else Text("-")
-            tokens_data = summary.get("tokens", {})
-            in_tokens_text = Text(str(tokens_data.get("prompt_tokens")) if tokens_data.get("prompt_tokens") is not None else "-")
-            out_tokens_text = Text(str(tokens_data.get("candidates_tokens")) if tokens_data.get("candidates_tokens") is not None else "-")
-            total_tokens_text = Text(str(tokens_data.get("total_tokens")) if tokens_data.get("total_tokens") is not None else "-")
-            train_passed = Text("✔") if summary.get("train_passed") else (Text("✘") if summary.get("train_passed") is False else Text("-"))
-            test_passed = Text("✔") if summary.get("test_passed") else (Text("✘") if summary.get("test_passed") is False else Text("-"))
-            best_score_text = Text(f"{summary.get('best_score'):.2f}" if summary.get("best_score") is not None else "-")
-
-            # Return tuple matching column order for get_sort_key
-            return (
-                session_name, error_text, test_passed, train_passed, best_score_text,
-                num_steps, time_str, in_tokens_text, out_tokens_text, total_tokens_text,
-                task_weight # Placeholder weight
-            )
-        except Exception:
-             # Return a default tuple that sorts predictably on error
-             return (session_name, Text("ERR"), Text("-"), Text("-"), Text("-"),
-                     Text("-"), Text("-"), Text("-"), Text("-"), Text("-"),
-                     Text("-"))
@@ -1,13 +1,13 @@
 """Defines the main SessionsNavigator Textual App class."""
 
-from textual.app import App, ComposeResult
+from textual.app import ComposeResult
 from textual.widgets import Static
 from textual.containers import Container # Import Container
 from pathlib import Path
 import argparse
 import json
+import os
 import re
-import subprocess # ADDED import
 import shutil # ADDED import
 from textual import log # Added log
 from textual.binding import Binding # Added Binding
@@ -21,10 +21,35 @@ from geometor.seer_navigator.screens.step_screen import StepScreen
 from geometor.seer_navigator.screens.trial_screen import TrialViewer
 # Import the modal screens
 from geometor.seer_navigator.screens.image_view_modal import ImageViewModal
-from geometor.seer_navigator.screens.sort_modal import SortModal
+from geometor.seer_navigator.navigator_app import NavigatorApp
 from textual.widgets._data_table import ColumnKey # Ensure ColumnKey is imported
 from textual.screen import Screen # Import Screen for type hinting
 
+def _find_pngs(root: Path) -> list[str]:
+    """Returns the paths of all .png files under root, sorted.
+
+    Walks with os.scandir and filters on DirEntry names, so no Path objects
+    are built and no entries are stat'ed just to be discarded. Directories
+    that cannot be read are skipped, as rglob does. Paths are sorted by
+    component so the order matches sorting the rglob Paths.
+    """
+    image_files = []
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError as e:
+            log.warning(f"Skipping unreadable directory while finding images: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".png"):
+                    image_files.append(entry.path)
+    image_files.sort(key=lambda path: path.split(os.sep))
+    return image_files
+
 # Define DummyGrid first so it's always available
 class DummyGrid(Static):
     """Placeholder widget used when real renderers fail to import."""
@@ -53,7 +78,7 @@ except ImportError:
     SolidGrid = BlockGrid = CharGrid = TinyGrid = DummyGrid
 
 
-class SessionsNavigator(App):
+class SessionsNavigator(NavigatorApp):
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -143,10 +168,14 @@ class SessionsNavigator(App):
     def action_refresh_screen(self) -> None:
         """Calls the refresh method on the current screen if it exists."""
         current_screen = self.screen
-        if hasattr(current_screen, "refresh_content"):
+        # Screens that debounce refreshes expose schedule_refresh; prefer it
+        refresh = getattr(current_screen, "schedule_refresh", None) or getattr(current_screen, "refresh_content", None)
+        if refresh is not None:
             log.info(f"Refreshing screen: {current_screen.__class__.__name__}")
-            current_screen.refresh_content()
-            self.notify("Screen refreshed")
+            refresh()
+            # Debounced screens notify from their timer, once the refresh has run
+            if not hasattr(current_screen, "schedule_refresh"):
+                self.notify("Screen refreshed")
         else:
             log.warning(f"Screen {current_screen.__class__.__name__} has no refresh_content method.")
             self.notify("Refresh not supported on this screen", severity="warning")
@@ -196,7 +225,7 @@ class SessionsNavigator(App):
 
             # --- Step 1: Find all potentially relevant files ---
             if filter_type == "all":
-                all_found_files = sorted(list(context_path.rglob("*.png")))
+                all_found_files = _find_pngs(context_path) # Plain path strings, ready for the command
                 final_image_files = all_found_files # No uniqueness needed for 'all'
             elif filter_type == "tasks":
                 all_found_files = sorted(list(context_path.rglob("**/task.png"))) # Use **/ to ensure we get task dir
@@ -259,11 +288,8 @@ class SessionsNavigator(App):
                 log.info(f"No images found for filter '{filter_type}' in {context_path}")
                 return
 
-            # Prepare the command list
-            command = [sxiv_cmd] + [str(img_path) for img_path in final_image_files]
-
             log.info(f"Opening {len(final_image_files)} images with sxiv (filter: {filter_type})")
-            subprocess.Popen(command)
+            self._open_in_sxiv(sxiv_cmd, final_image_files)
 
         except FileNotFoundError:
             # This case should be caught by _check_sxiv, but handle defensively
@@ -284,29 +310,29 @@ class SessionsNavigator(App):
         if hasattr(current_screen, "table") and hasattr(current_screen.table, "columns") and current_screen.table.columns:
             log.info(f"Opening SortModal for screen: {current_screen.__class__.__name__}")
 
+            # Resolve the sort method once; the modal only hands back a ColumnKey via dismiss()
+            perform_sort = getattr(current_screen, "perform_sort", None)
+            if perform_sort is None:
+                log.error(f"Screen {current_screen.__class__.__name__} has no perform_sort method.")
+                self.notify("Sort function not implemented on current screen.", severity="error")
+                return
+
             # Define the callback function to handle the result from SortModal
             def handle_sort_dismiss(selected_key: ColumnKey | None) -> None:
                 """Callback executed when SortModal is dismissed."""
-                # Ensure the screen context is still valid (might have changed)
-                active_screen = self.screen_stack[-1]
-                if selected_key:
-                    log.info(f"SortModal dismissed for {active_screen.__class__.__name__}, sorting by: {selected_key}")
-                    if hasattr(active_screen, "perform_sort"):
-                        try:
-                            # Call perform_sort on the screen that was active
-                            active_screen.perform_sort(selected_key)
-                        except Exception as e:
-                            log.exception(f"Error calling perform_sort on {active_screen.__class__.__name__} after SortModal dismiss: {e}")
-                            self.notify(f"Error during sort: {e}", severity="error")
-                    else:
-                        log.error(f"Screen {active_screen.__class__.__name__} has no perform_sort method.")
-                        self.notify("Sort function not implemented on current screen.", severity="error")
-                else:
-                    log.info(f"SortModal dismissed (cancelled) for {active_screen.__class__.__name__}.")
+                if selected_key is None:
+                    log.info(f"SortModal dismissed (cancelled) for {current_screen.__class__.__name__}.")
+                    return # Nothing to re-render on cancel
+                log.info("SortModal dismissed for", current_screen.__class__.__name__, "sorting by:", selected_key)
+                try:
+                    perform_sort(selected_key)
+                except Exception as e:
+                    log.exception(f"Error calling perform_sort on {current_screen.__class__.__name__} after SortModal dismiss: {e}")
+                    self.notify(f"Error during sort: {e}", severity="error")
 
             # Push the SortModal screen with the callback
             self.push_screen(
-                SortModal(columns=current_screen.table.columns),
+                self._get_sort_modal(current_screen.table.columns),
                 handle_sort_dismiss # Pass the callback function
             )
         else:
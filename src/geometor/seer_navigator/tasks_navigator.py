@@ -2,11 +2,10 @@
 
 import argparse
 from pathlib import Path
-import subprocess # ADDED import
 import shutil # ADDED import
 import json # ADDED import
 
-from textual.app import App, ComposeResult
+from textual.app import ComposeResult
 from textual.containers import Container
 from textual.binding import Binding
 from textual import log
@@ -40,13 +39,13 @@ except ImportError:
 from geometor.seer_navigator.screens.tasks_screen import TasksScreen
 from geometor.seer_navigator.screens.task_sessions_screen import TaskSessionsScreen
 from geometor.seer_navigator.screens.task_screen import TaskScreen # ADDED import
-from geometor.seer_navigator.screens.sort_modal import SortModal
+from geometor.seer_navigator.navigator_app import NavigatorApp
 from geometor.seer_navigator.screens.image_view_modal import ImageViewModal
 from textual.widgets._data_table import ColumnKey # Ensure ColumnKey is imported
 from textual.screen import Screen # Import Screen for type hinting
 
 
-class TasksNavigator(App):
+class TasksNavigator(NavigatorApp):
     """A Textual app to navigate aggregated task data across sessions."""
 
     BINDINGS = [
@@ -94,10 +93,14 @@ class TasksNavigator(App):
     def action_refresh_screen(self) -> None:
         """Calls the refresh method on the current screen if it exists."""
         current_screen = self.screen
-        if hasattr(current_screen, "refresh_content"):
+        # Screens that debounce refreshes expose schedule_refresh; prefer it
+        refresh = getattr(current_screen, "schedule_refresh", None) or getattr(current_screen, "refresh_content", None)
+        if refresh is not None:
             log.info(f"Refreshing screen: {current_screen.__class__.__name__}")
-            current_screen.refresh_content()
-            self.notify("Screen refreshed")
+            refresh()
+            # Debounced screens notify from their timer, once the refresh has run
+            if not hasattr(current_screen, "schedule_refresh"):
+                self.notify("Screen refreshed")
         else:
             log.warning(f"Screen {current_screen.__class__.__name__} has no refresh_content method.")
             self.notify("Refresh not supported on this screen", severity="warning")
@@ -112,29 +115,29 @@ class TasksNavigator(App):
         if hasattr(current_screen, "table") and hasattr(current_screen.table, "columns") and current_screen.table.columns:
             log.info(f"Opening SortModal for screen: {current_screen.__class__.__name__}")
 
+            # Resolve the sort method once; the modal only hands back a ColumnKey via dismiss()
+            perform_sort = getattr(current_screen, "perform_sort", None)
+            if perform_sort is None:
+                log.error(f"Screen {current_screen.__class__.__name__} has no perform_sort method.")
+                self.notify("Sort function not implemented on current screen.", severity="error")
+                return
+
             # Define the callback function to handle the result from SortModal
             def handle_sort_dismiss(selected_key: ColumnKey | None) -> None:
                 """Callback executed when SortModal is dismissed."""
-                # Ensure the screen context is still valid
-                active_screen = self.screen_stack[-1]
-                if selected_key:
-                    log.info(f"SortModal dismissed for {active_screen.__class__.__name__}, sorting by: {selected_key}")
-                    if hasattr(active_screen, "perform_sort"):
-                        try:
-                            # Call perform_sort on the screen that was active
-                            active_screen.perform_sort(selected_key)
-                        except Exception as e:
-                            log.exception(f"Error calling perform_sort on {active_screen.__class__.__name__} after SortModal dismiss: {e}")
-                            self.notify(f"Error during sort: {e}", severity="error")
-                    else:
-                        log.error(f"Screen {active_screen.__class__.__name__} has no perform_sort method.")
-                        self.notify("Sort function not implemented on current screen.", severity="error")
-                else:
-                    log.info(f"SortModal dismissed (cancelled) for {active_screen.__class__.__name__}.")
+                if selected_key is None:
+                    log.info(f"SortModal dismissed (cancelled) for {current_screen.__class__.__name__}.")
+                    return # Nothing to re-render on cancel
+                log.info("SortModal dismissed for", current_screen.__class__.__name__, "sorting by:", selected_key)
+                try:
+                    perform_sort(selected_key)
+                except Exception as e:
+                    log.exception(f"Error calling perform_sort on {current_screen.__class__.__name__} after SortModal dismiss: {e}")
+                    self.notify(f"Error during sort: {e}", severity="error")
 
             # Push the SortModal screen with the callback
             self.push_screen(
-                SortModal(columns=current_screen.table.columns),
+                self._get_sort_modal(current_screen.table.columns),
                 handle_sort_dismiss # Pass the callback function
             )
         else:
@@ -286,11 +289,8 @@ class TasksNavigator(App):
                 log.info(f"No images found for filter '{filter_type}' in {context_path}")
                 return
 
-            # Prepare the command list
-            command = [sxiv_cmd] + [str(img_path) for img_path in final_image_files]
-
             log.info(f"Opening {len(final_image_files)} images with sxiv (filter: {filter_type}, task_id: {task_id}, context: {context_path})")
-            subprocess.Popen(command)
+            self._open_in_sxiv(sxiv_cmd, final_image_files)
 
         except FileNotFoundError:
             # This case should be caught by _check_sxiv, but handle defensively
@@ -0,0 +1,41 @@
+"""Shared scaffolding for the screen refresh tests."""
+
+import asyncio
+
+import pytest
+
+
+def _column_widths(screen) -> list[int]:
+    return [screen.table.columns[key].content_width for key in screen._col_keys]
+
+
+@pytest.fixture
+def check_refresh_widths():
+    """Returns a runner that pushes ``make_screen()`` in a headless app, applies
+    ``change`` to its files, refreshes in place and asserts the column widths
+    match a full ``rebuild`` and differ from before the change."""
+    from textual.app import App
+
+    def run_check(make_screen, change, rebuild) -> None:
+        async def run() -> None:
+            app = App()
+            async with app.run_test() as pilot:
+                screen = make_screen()
+                await app.push_screen(screen)
+                await pilot.pause()
+                before_widths = _column_widths(screen)
+
+                change()
+                screen.refresh_content()
+                await pilot.pause()
+                refreshed_widths = _column_widths(screen)
+
+                # A full rebuild is the reference for the widths the cells need
+                rebuild(screen)
+                await pilot.pause()
+                assert refreshed_widths == _column_widths(screen)
+                assert refreshed_widths != before_widths
+
+        asyncio.run(run())
+
+    return run_check
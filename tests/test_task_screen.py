@@ -0,0 +1,41 @@
+"""Tests for refreshing the TaskScreen steps table in place."""
+
+import json
+
+import pytest
+
+pytest.importorskip("textual")
+pytest.importorskip("geometor.seer")
+
+from geometor.seer_navigator.screens.task_screen import TaskScreen
+
+
+WIDE_SUMMARY = {
+    "has_errors": True,
+    "train_passed": True,
+    "test_passed": False,
+    "best_score": 12345.67,
+    "pixels_off": 123456789,
+    "percent_correct": 99.5,
+    "duration_seconds": 98765,
+    "attempts": 1000,
+    "response": {
+        "prompt_tokens": 1234567,
+        "candidates_tokens": 7654321,
+        "total_tokens": 8888888,
+    },
+}
+
+
+def test_refresh_grows_column_widths(tmp_path, check_refresh_widths):
+    session_path = tmp_path / "session"
+    task_path = session_path / "task"
+    step_dir = task_path / "000"
+    step_dir.mkdir(parents=True)
+
+    # No index.json yet, so the step starts with placeholder cells
+    check_refresh_widths(
+        lambda: TaskScreen(session_path, task_path, [step_dir]),
+        change=lambda: (step_dir / "index.json").write_text(json.dumps(WIDE_SUMMARY)),
+        rebuild=TaskScreen.load_steps,
+    )
@@ -0,0 +1,48 @@
+"""Tests for refreshing the TaskSessionsScreen instances table in place."""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("textual")
+pytest.importorskip("geometor.seer")
+
+from geometor.seer_navigator.screens.task_sessions_screen import TaskSessionsScreen
+
+
+NARROW_SUMMARY = {"steps": 1}
+
+WIDE_SUMMARY = {
+    "steps": 123456,
+    "duration_seconds": 98765,
+    "has_errors": True,
+    "train_passed": True,
+    "test_passed": False,
+    "best_score": 12345.67,
+    "tokens": {
+        "prompt_tokens": 1234567,
+        "candidates_tokens": 7654321,
+        "total_tokens": 8888888,
+    },
+}
+
+
+def test_refresh_grows_column_widths(tmp_path, check_refresh_widths):
+    sessions_root = tmp_path / "sessions"
+    task_dir = sessions_root / "session-1" / "task-1"
+    task_dir.mkdir(parents=True)
+    index_path = task_dir / "index.json"
+    index_path.write_text(json.dumps(NARROW_SUMMARY))
+
+    def widen() -> None:
+        index_path.write_text(json.dumps(WIDE_SUMMARY))
+        # Make sure the fingerprint sees the change on coarse mtime filesystems
+        mtime_ns = os.stat(index_path).st_mtime_ns + 1_000_000_000
+        os.utime(index_path, ns=(mtime_ns, mtime_ns))
+
+    check_refresh_widths(
+        lambda: TaskSessionsScreen(sessions_root, "task-1"),
+        change=widen,
+        rebuild=TaskSessionsScreen.load_task_instances,
+    )